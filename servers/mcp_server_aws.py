@@ -7,16 +7,25 @@ import asyncio
 import json
 import logging
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import re
 import sys
 import os
-from typing import Any, Dict, List
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, Union
 
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import Resource, Tool, TextContent
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 # Add the core module to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
 from pii_agent import AWSPIIDetectionAgent, PIIDetectionConfig
@@ -26,80 +35,243 @@ logger = logging.getLogger("aws-pii-detection-mcp")
 
 server = Server("aws-pii-detection-agent")
 
+# Maximum number of S3 objects read concurrently during a bucket scan
+S3_READ_CONCURRENCY = 20
+
+# Number of leading bytes sampled from each S3 object
+S3_SAMPLE_BYTES = 1024
+
+# Object keys that are scanned as text, matched by extension in a single regex pass
+_TEXT_KEY_RE = re.compile(r'\.(?:txt|csv|json|log|tsv|ndjson)$')
+
+# Structured objects are sampled by row with S3 Select instead of by byte range
+S3_SELECT_ROW_LIMIT = 50
+S3_SELECT_INPUT = {
+    '.csv': {'CSV': {}, 'CompressionType': 'NONE'},
+    '.json': {'JSON': {'Type': 'DOCUMENT'}, 'CompressionType': 'NONE'},
+}
+
+# PII patterns fused into a single regex; each match's group name is its PII type.
+# The patterns are ASCII-only, so they run on raw bytes and samples need no decoding.
+PII_PATTERNS = {
+    'EMAIL': rb'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+    'SSN': rb'\b\d{3}-\d{2}-\d{4}\b',
+    'PHONE': rb'\b\d{3}-\d{3}-\d{4}\b',
+}
+_PII_RE = re.compile(b'|'.join(
+    b'(?P<%s>%s)' % (name.encode('ascii'), pattern) for name, pattern in PII_PATTERNS.items()
+))
+
+# With Hyperscan installed the same patterns are compiled into one database per
+# process; scratch space can't be shared by concurrent scans, so each thread
+# allocates its own on first use
+_PII_TYPES = list(PII_PATTERNS)
+_HS_DB = None
+if hyperscan is not None:
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=list(PII_PATTERNS.values()),
+        ids=list(range(len(_PII_TYPES))),
+        elements=len(_PII_TYPES),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_PII_TYPES),
+    )
+_HS_SCRATCH = threading.local()
+
+def _hyperscan_pii_types(data: bytes) -> set:
+    """Return the PII types present in ``data`` using the shared Hyperscan database"""
+    scratch = getattr(_HS_SCRATCH, 'scratch', None)
+    if scratch is None:
+        scratch = _HS_SCRATCH.scratch = hyperscan.Scratch(_HS_DB)
+
+    found = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        found.add(_PII_TYPES[pattern_id])
+        # A truthy return stops the scan once every type has been seen
+        return len(found) == len(_PII_TYPES)
+
+    try:
+        _HS_DB.scan(data, match_event_handler=on_match, scratch=scratch)
+    except hyperscan.ScanTerminated:
+        pass
+    return found
+
+# Number of parallel segments used when scanning a DynamoDB table
+DYNAMODB_SCAN_SEGMENTS = 4
+
+# Maximum number of buckets/tables shown by the list tools
+LIST_DISPLAY_LIMIT = 20
+
+# All clients share one session; the pool is sized above S3_READ_CONCURRENCY so
+# parallel object reads never queue for a connection
+_BOTO_SESSION = boto3.session.Session()
+_BOTO_CFG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 3},
+    tcp_keepalive=True,
+)
+
 class AWSPIIDetector:
     def __init__(self, region='us-west-2'):
         self.region = region
-        self.s3 = boto3.client('s3', region_name=region)
-        self.dynamodb = boto3.client('dynamodb', region_name=region)
-        self.glue = boto3.client('glue', region_name=region)
+        self.s3 = _BOTO_SESSION.client('s3', region_name=region, config=_BOTO_CFG)
+        self.dynamodb = _BOTO_SESSION.client('dynamodb', region_name=region, config=_BOTO_CFG)
+        self.glue = _BOTO_SESSION.client('glue', region_name=region, config=_BOTO_CFG)
         
-    def detect_pii_in_text(self, text: str) -> List[str]:
+    def detect_pii_in_text(self, text: Union[str, bytes]) -> List[str]:
         """Simple PII detection patterns"""
-        pii_types = []
-        
-        # Email pattern
-        if re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text):
-            pii_types.append('EMAIL')
-        
-        # SSN pattern
-        if re.search(r'\b\d{3}-\d{2}-\d{4}\b', text):
-            pii_types.append('SSN')
-        
-        # Phone pattern
-        if re.search(r'\b\d{3}-\d{3}-\d{4}\b', text):
-            pii_types.append('PHONE')
-        
-        return pii_types
+        if isinstance(text, str):
+            text = text.encode('utf-8', errors='replace')
+        if _HS_DB is not None:
+            found = _hyperscan_pii_types(text)
+            return [pii_type for pii_type in PII_PATTERNS if pii_type in found]
+
+        found = set()
+        for match in _PII_RE.finditer(text):
+            found.add(match.lastgroup)
+            if len(found) == len(PII_PATTERNS):
+                # Every type is already present, the rest of the text can't add anything
+                break
+        return [pii_type for pii_type in PII_PATTERNS if pii_type in found]
     
+    def _select_s3_sample(self, bucket_name: str, key: str, input_serialization: Dict[str, Any]) -> bytes:
+        """Sample the first rows of a CSV/JSON object server-side with S3 Select"""
+        output_format = 'CSV' if 'CSV' in input_serialization else 'JSON'
+        response = self.s3.select_object_content(
+            Bucket=bucket_name,
+            Key=key,
+            ExpressionType='SQL',
+            Expression=f"SELECT * FROM S3Object s LIMIT {S3_SELECT_ROW_LIMIT}",
+            InputSerialization=input_serialization,
+            OutputSerialization={output_format: {}}
+        )
+
+        records = []
+        for event in response['Payload']:
+            if 'Records' in event:
+                records.append(event['Records']['Payload'])
+        return b''.join(records)
+
+    def _read_s3_sample(self, bucket_name: str, key: str) -> bytes:
+        """Fetch the leading bytes of an S3 object as a raw sample"""
+        input_serialization = S3_SELECT_INPUT.get(os.path.splitext(key)[1])
+        if input_serialization:
+            try:
+                return self._select_s3_sample(bucket_name, key, input_serialization)
+            except ClientError as e:
+                # S3 Select is not enabled for every account; fall back to a ranged GET
+                logger.debug(f"S3 Select unavailable for {key}: {e}")
+
+        # Only transfer the sample window, not the whole object
+        content = self.s3.get_object(
+            Bucket=bucket_name, Key=key, Range=f'bytes=0-{S3_SAMPLE_BYTES - 1}'
+        )
+        return content['Body'].read()
+
+    async def _scan_s3_object(self, semaphore: asyncio.Semaphore, bucket_name: str, obj: Dict[str, Any]):
+        """Scan a single S3 object for PII, bounded by the shared semaphore"""
+        key = obj['Key']
+        async with semaphore:
+            try:
+                sample = await asyncio.to_thread(self._read_s3_sample, bucket_name, key)
+            except Exception as e:
+                logger.warning(f"Error reading {key}: {e}")
+                return None
+
+        pii_types = self.detect_pii_in_text(sample)
+        if not pii_types:
+            return None
+
+        return {
+            'bucket': bucket_name,
+            'key': key,
+            'pii_types': pii_types,
+            'size': obj['Size']
+        }
+
     async def scan_s3_bucket(self, bucket_name: str, max_objects: int = 10):
         """Scan S3 bucket for PII"""
         try:
-            response = self.s3.list_objects_v2(Bucket=bucket_name, MaxKeys=max_objects)
+            response = await asyncio.to_thread(
+                self.s3.list_objects_v2, Bucket=bucket_name, MaxKeys=max_objects
+            )
+            filtered = [
+                obj for obj in response.get('Contents', ())
+                if _TEXT_KEY_RE.search(obj['Key'])
+            ]
+
+            # Object reads are independent round-trips, so overlap them
+            semaphore = asyncio.Semaphore(S3_READ_CONCURRENCY)
+            tasks = [self._scan_s3_object(semaphore, bucket_name, obj) for obj in filtered]
+            scanned = await asyncio.gather(*tasks, return_exceptions=True)
+
             results = []
-            
-            for obj in response.get('Contents', [])[:max_objects]:
-                key = obj['Key']
-                if key.endswith(('.txt', '.csv', '.json')):
-                    try:
-                        content = self.s3.get_object(Bucket=bucket_name, Key=key)
-                        text = content['Body'].read().decode('utf-8')[:1000]  # First 1KB
-                        pii_types = self.detect_pii_in_text(text)
-                        
-                        if pii_types:
-                            results.append({
-                                'bucket': bucket_name,
-                                'key': key,
-                                'pii_types': pii_types,
-                                'size': obj['Size']
-                            })
-                    except Exception as e:
-                        logger.warning(f"Error reading {key}: {e}")
-            
+            for obj, result in zip(filtered, scanned):
+                if isinstance(result, Exception):
+                    logger.warning(f"Error scanning {obj['Key']}: {result}")
+                elif result:
+                    results.append(result)
+
             return results
         except Exception as e:
             logger.error(f"Error scanning S3 bucket {bucket_name}: {e}")
             return []
     
+    def list_first(self, client, operation: str, result_key: str, limit: int) -> List[Any]:
+        """Return up to ``limit`` entries from a list API, stopping once enough pages are read"""
+        if client.can_paginate(operation):
+            pages = client.get_paginator(operation).paginate(
+                PaginationConfig={'MaxItems': limit, 'PageSize': limit}
+            )
+        else:
+            pages = [getattr(client, operation)()]
+        entries = []
+        for page in pages:
+            entries.extend(page.get(result_key, []))
+            if len(entries) >= limit:
+                break
+        return entries[:limit]
+
+    def _scan_dynamodb_segment(self, table_name: str, segment: int, total_segments: int, limit: int):
+        """Read up to ``limit`` items from one parallel-scan segment, following pagination"""
+        items = []
+        scan_kwargs = {
+            'TableName': table_name,
+            'Segment': segment,
+            'TotalSegments': total_segments
+        }
+        while len(items) < limit:
+            response = self.dynamodb.scan(Limit=limit - len(items), **scan_kwargs)
+            items.extend(response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                break
+            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        return items
+
     async def scan_dynamodb_table(self, table_name: str, max_items: int = 10):
         """Scan DynamoDB table for PII"""
         try:
-            response = self.dynamodb.scan(
-                TableName=table_name,
-                Limit=max_items
-            )
+            # Split the scan into segments that DynamoDB serves in parallel
+            total_segments = max(1, min(DYNAMODB_SCAN_SEGMENTS, max_items))
+            segment_limit = -(-max_items // total_segments)
+            segments = await asyncio.gather(*[
+                asyncio.to_thread(
+                    self._scan_dynamodb_segment, table_name, segment, total_segments, segment_limit
+                )
+                for segment in range(total_segments)
+            ])
+            items = [item for segment_items in segments for item in segment_items][:max_items]
             
             results = []
-            for item in response.get('Items', []):
-                pii_types = []
-                for attr_name, attr_value in item.items():
-                    if 'S' in attr_value:  # String attribute
-                        text = attr_value['S']
-                        pii_types.extend(self.detect_pii_in_text(text))
+            for item in items:
+                # Scan all string attributes of the item in a single regex pass
+                text = '\n'.join(value['S'] for value in item.values() if 'S' in value)
+                pii_types = self.detect_pii_in_text(text.encode('utf-8', errors='replace'))
                 
                 if pii_types:
                     results.append({
                         'table': table_name,
-                        'pii_types': list(set(pii_types)),
+                        'pii_types': pii_types,
                         'attributes': list(item.keys())
                     })
             
@@ -108,461 +280,519 @@ class AWSPIIDetector:
             logger.error(f"Error scanning DynamoDB table {table_name}: {e}")
             return []
 
-@server.list_tools()
-async def handle_list_tools() -> List[Tool]:
-    return [
-        Tool(
-            name="scan_s3_real",
-            description="Scan real S3 bucket for PII content",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "bucket_name": {"type": "string", "description": "S3 bucket name"},
-                    "region": {"type": "string", "default": "us-west-2"},
-                    "max_objects": {"type": "integer", "default": 10, "maximum": 50}
-                },
-                "required": ["bucket_name"]
-            }
-        ),
-        Tool(
-            name="scan_dynamodb_real",
-            description="Scan real DynamoDB table for PII content",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {"type": "string", "description": "DynamoDB table name"},
-                    "region": {"type": "string", "default": "us-west-2"},
-                    "max_items": {"type": "integer", "default": 10, "maximum": 100}
-                },
-                "required": ["table_name"]
-            }
-        ),
-        Tool(
-            name="list_s3_buckets",
-            description="List available S3 buckets",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {"type": "string", "default": "us-west-2"}
-                }
-            }
-        ),
-        Tool(
-            name="list_dynamodb_tables",
-            description="List available DynamoDB tables",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {"type": "string", "default": "us-west-2"}
-                }
-            }
-        ),
-        Tool(
-            name="create_lf_tags",
-            description="Create Lake Formation tag definitions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "region": {"type": "string", "default": "us-west-2"},
-                    "dry_run": {"type": "boolean", "default": True}
-                }
+# Tool definitions are static, so build them once at import time
+_TOOLS: List[Tool] = [
+    Tool(
+        name="scan_s3_real",
+        description="Scan real S3 bucket for PII content",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "bucket_name": {"type": "string", "description": "S3 bucket name"},
+                "region": {"type": "string", "default": "us-west-2"},
+                "max_objects": {"type": "integer", "default": 10, "maximum": 50}
+            },
+            "required": ["bucket_name"]
+        }
+    ),
+    Tool(
+        name="scan_dynamodb_real",
+        description="Scan real DynamoDB table for PII content",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {"type": "string", "description": "DynamoDB table name"},
+                "region": {"type": "string", "default": "us-west-2"},
+                "max_items": {"type": "integer", "default": 10, "maximum": 100}
+            },
+            "required": ["table_name"]
+        }
+    ),
+    Tool(
+        name="list_s3_buckets",
+        description="List available S3 buckets",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {"type": "string", "default": "us-west-2"}
             }
-        ),
-        Tool(
-            name="register_s3_with_lakeformation",
-            description="Register S3 location with Lake Formation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "s3_path": {"type": "string", "description": "S3 path to register (e.g., s3://bucket/path/)"},
-                    "region": {"type": "string", "default": "us-west-2"},
-                    "dry_run": {"type": "boolean", "default": True}
-                },
-                "required": ["s3_path"]
+        }
+    ),
+    Tool(
+        name="list_dynamodb_tables",
+        description="List available DynamoDB tables",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {"type": "string", "default": "us-west-2"}
             }
-        ),
-        Tool(
-            name="register_table_with_lakeformation",
-            description="Register Glue table with Lake Formation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_name": {"type": "string", "description": "Glue database name"},
-                    "table_name": {"type": "string", "description": "Glue table name"},
-                    "region": {"type": "string", "default": "us-west-2"},
-                    "dry_run": {"type": "boolean", "default": True}
-                },
-                "required": ["database_name", "table_name"]
-            }
-        ),
-        Tool(
-            name="apply_lf_tags",
-            description="Apply Lake Formation tags to resources based on PII detection",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_name": {"type": "string", "description": "Glue database name"},
-                    "table_name": {"type": "string", "description": "Glue table name"},
-                    "column_name": {"type": "string", "description": "Column name (optional)"},
-                    "pii_types": {"type": "array", "items": {"type": "string"}, "description": "List of detected PII types"},
-                    "region": {"type": "string", "default": "us-west-2"},
-                    "dry_run": {"type": "boolean", "default": True}
-                },
-                "required": ["database_name", "table_name"]
-            }
-        ),
-        Tool(
-            name="manage_lake_formation_tags",
-            description="Manage Lake Formation tag definitions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "operation": {"type": "string", "enum": ["create", "delete", "update", "list"]},
-                    "tag_key": {"type": "string", "description": "Tag key name"},
-                    "tag_values": {"type": "array", "items": {"type": "string"}, "description": "Tag values"},
-                    "region": {"type": "string", "default": "us-west-2"},
-                    "dry_run": {"type": "boolean", "default": True}
-                },
-                "required": ["operation"]
-            }
-        ),
-        Tool(
-            name="register_lake_formation_resources",
-            description="Register resources with Lake Formation",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resource_type": {"type": "string", "enum": ["s3", "table", "database"]},
-                    "resource_arn": {"type": "string", "description": "Resource ARN for S3 locations"},
-                    "database_name": {"type": "string", "description": "Database name for tables"},
-                    "table_name": {"type": "string", "description": "Table name"},
-                    "region": {"type": "string", "default": "us-west-2"},
-                    "dry_run": {"type": "boolean", "default": True}
-                },
-                "required": ["resource_type"]
-            }
-        ),
-        Tool(
-            name="apply_lake_formation_tags",
-            description="Apply Lake Formation tags to specific resources",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database_name": {"type": "string", "description": "Database name"},
-                    "table_name": {"type": "string", "description": "Table name"},
-                    "column_name": {"type": "string", "description": "Column name (optional)"},
-                    "lf_tags": {"type": "array", "items": {"type": "object"}, "description": "Lake Formation tags to apply"},
-                    "region": {"type": "string", "default": "us-west-2"},
-                    "dry_run": {"type": "boolean", "default": True}
-                },
-                "required": ["database_name", "table_name"]
-            }
-        ),
-        Tool(
-            name="manage_lake_formation_permissions",
-            description="Manage Lake Formation permissions and access control",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "operation": {"type": "string", "enum": ["grant", "revoke", "list"]},
-                    "principal": {"type": "string", "description": "IAM principal (user/role ARN)"},
-                    "resource": {"type": "object", "description": "Resource definition"},
-                    "permissions": {"type": "array", "items": {"type": "string"}, "description": "Permissions to grant/revoke"},
-                    "region": {"type": "string", "default": "us-west-2"},
-                    "dry_run": {"type": "boolean", "default": True}
-                },
-                "required": ["operation"]
+        }
+    ),
+    Tool(
+        name="create_lf_tags",
+        description="Create Lake Formation tag definitions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "region": {"type": "string", "default": "us-west-2"},
+                "dry_run": {"type": "boolean", "default": True}
             }
+        }
+    ),
+    Tool(
+        name="register_s3_with_lakeformation",
+        description="Register S3 location with Lake Formation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "s3_path": {"type": "string", "description": "S3 path to register (e.g., s3://bucket/path/)"},
+                "region": {"type": "string", "default": "us-west-2"},
+                "dry_run": {"type": "boolean", "default": True}
+            },
+            "required": ["s3_path"]
+        }
+    ),
+    Tool(
+        name="register_table_with_lakeformation",
+        description="Register Glue table with Lake Formation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_name": {"type": "string", "description": "Glue database name"},
+                "table_name": {"type": "string", "description": "Glue table name"},
+                "region": {"type": "string", "default": "us-west-2"},
+                "dry_run": {"type": "boolean", "default": True}
+            },
+            "required": ["database_name", "table_name"]
+        }
+    ),
+    Tool(
+        name="apply_lf_tags",
+        description="Apply Lake Formation tags to resources based on PII detection",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_name": {"type": "string", "description": "Glue database name"},
+                "table_name": {"type": "string", "description": "Glue table name"},
+                "column_name": {"type": "string", "description": "Column name (optional)"},
+                "pii_types": {"type": "array", "items": {"type": "string"}, "description": "List of detected PII types"},
+                "region": {"type": "string", "default": "us-west-2"},
+                "dry_run": {"type": "boolean", "default": True}
+            },
+            "required": ["database_name", "table_name"]
+        }
+    ),
+    Tool(
+        name="manage_lake_formation_tags",
+        description="Manage Lake Formation tag definitions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operation": {"type": "string", "enum": ["create", "delete", "update", "list"]},
+                "tag_key": {"type": "string", "description": "Tag key name"},
+                "tag_values": {"type": "array", "items": {"type": "string"}, "description": "Tag values"},
+                "region": {"type": "string", "default": "us-west-2"},
+                "dry_run": {"type": "boolean", "default": True}
+            },
+            "required": ["operation"]
+        }
+    ),
+    Tool(
+        name="register_lake_formation_resources",
+        description="Register resources with Lake Formation",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resource_type": {"type": "string", "enum": ["s3", "table", "database"]},
+                "resource_arn": {"type": "string", "description": "Resource ARN for S3 locations"},
+                "database_name": {"type": "string", "description": "Database name for tables"},
+                "table_name": {"type": "string", "description": "Table name"},
+                "region": {"type": "string", "default": "us-west-2"},
+                "dry_run": {"type": "boolean", "default": True}
+            },
+            "required": ["resource_type"]
+        }
+    ),
+    Tool(
+        name="apply_lake_formation_tags",
+        description="Apply Lake Formation tags to specific resources",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database_name": {"type": "string", "description": "Database name"},
+                "table_name": {"type": "string", "description": "Table name"},
+                "column_name": {"type": "string", "description": "Column name (optional)"},
+                "lf_tags": {"type": "array", "items": {"type": "object"}, "description": "Lake Formation tags to apply"},
+                "region": {"type": "string", "default": "us-west-2"},
+                "dry_run": {"type": "boolean", "default": True}
+            },
+            "required": ["database_name", "table_name"]
+        }
+    ),
+    Tool(
+        name="manage_lake_formation_permissions",
+        description="Manage Lake Formation permissions and access control",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operation": {"type": "string", "enum": ["grant", "revoke", "list"]},
+                "principal": {"type": "string", "description": "IAM principal (user/role ARN)"},
+                "resource": {"type": "object", "description": "Resource definition"},
+                "permissions": {"type": "array", "items": {"type": "string"}, "description": "Permissions to grant/revoke"},
+                "region": {"type": "string", "default": "us-west-2"},
+                "dry_run": {"type": "boolean", "default": True}
+            },
+            "required": ["operation"]
+        }
+    )
+]
+
+@server.list_tools()
+async def handle_list_tools() -> List[Tool]:
+    return _TOOLS
+
+_DETECTORS: Dict[str, AWSPIIDetector] = {}
+
+def _get_detector(region: str) -> AWSPIIDetector:
+    """Return the detector for a region, creating its clients on first use"""
+    detector = _DETECTORS.get(region)
+    if detector is None:
+        detector = _DETECTORS[region] = AWSPIIDetector(region)
+    return detector
+
+@dataclass
+class _CommonArgs:
+    """Arguments shared by every tool, parsed once per call"""
+    __slots__ = ('region', 'dry_run')
+    region: str
+    dry_run: bool
+
+def _common(arguments: Dict[str, Any]) -> _CommonArgs:
+    return _CommonArgs(arguments.get("region", "us-west-2"), arguments.get("dry_run", True))
+
+_AGENTS: Dict[Tuple[str, bool], AWSPIIDetectionAgent] = {}
+
+def _get_agent(region: str, dry_run: bool) -> AWSPIIDetectionAgent:
+    """Return the Lake Formation agent for a region and mode, creating it on first use"""
+    key = (region, dry_run)
+    agent = _AGENTS.get(key)
+    if agent is None:
+        config = PIIDetectionConfig(aws_region=region, dry_run=dry_run)
+        agent = _AGENTS[key] = AWSPIIDetectionAgent(config)
+    return agent
+
+async def _handle_scan_s3_real(arguments: Dict[str, Any]) -> List[TextContent]:
+    common = _common(arguments)
+    detector = _get_detector(common.region)
+    
+    bucket_name = arguments["bucket_name"]
+    max_objects = arguments.get("max_objects", 10)
+    
+    results = await detector.scan_s3_bucket(bucket_name, max_objects)
+    
+    if results:
+        parts = [f"🔍 S3 PII Scan Results - Bucket: {bucket_name}\n\n"]
+        for result in results:
+            parts.append(f"📄 {result['key']}\n")
+            parts.append(f"   PII Types: {', '.join(result['pii_types'])}\n")
+            parts.append(f"   Size: {result['size']} bytes\n\n")
+        text = "".join(parts)
+    else:
+        text = f"✅ No PII found in bucket: {bucket_name}"
+    
+    return [TextContent(type="text", text=text)]
+
+async def _handle_scan_dynamodb_real(arguments: Dict[str, Any]) -> List[TextContent]:
+    common = _common(arguments)
+    detector = _get_detector(common.region)
+    
+    table_name = arguments["table_name"]
+    max_items = arguments.get("max_items", 10)
+    
+    results = await detector.scan_dynamodb_table(table_name, max_items)
+    
+    if results:
+        parts = [f"🔍 DynamoDB PII Scan Results - Table: {table_name}\n\n"]
+        for result in results:
+            parts.append(f"📊 PII Types: {', '.join(result['pii_types'])}\n")
+            parts.append(f"   Attributes: {', '.join(result['attributes'])}\n\n")
+        text = "".join(parts)
+    else:
+        text = f"✅ No PII found in table: {table_name}"
+    
+    return [TextContent(type="text", text=text)]
+
+async def _handle_list_s3_buckets(arguments: Dict[str, Any]) -> List[TextContent]:
+    common = _common(arguments)
+    detector = _get_detector(common.region)
+    
+    try:
+        # Fetch one entry past the limit so we know whether to say "more"
+        response = await asyncio.to_thread(
+            detector.list_first, detector.s3, 'list_buckets', 'Buckets', LIST_DISPLAY_LIMIT + 1
+        )
+        buckets = [bucket['Name'] for bucket in response]
+        parts = [f"📦 S3 Buckets in {common.region}:\n\n"]
+        for bucket in buckets[:LIST_DISPLAY_LIMIT]:
+            parts.append(f"   • {bucket}\n")
+        if len(buckets) > LIST_DISPLAY_LIMIT:
+            parts.append("   ... and more")
+        text = "".join(parts)
+    except Exception as e:
+        text = f"❌ Error listing S3 buckets: {str(e)}"
+    
+    return [TextContent(type="text", text=text)]
+
+async def _handle_list_dynamodb_tables(arguments: Dict[str, Any]) -> List[TextContent]:
+    common = _common(arguments)
+    detector = _get_detector(common.region)
+    
+    try:
+        tables = await asyncio.to_thread(
+            detector.list_first, detector.dynamodb, 'list_tables', 'TableNames', LIST_DISPLAY_LIMIT + 1
         )
-    ]
+        parts = [f"🗃️ DynamoDB Tables in {common.region}:\n\n"]
+        for table in tables[:LIST_DISPLAY_LIMIT]:
+            parts.append(f"   • {table}\n")
+        if len(tables) > LIST_DISPLAY_LIMIT:
+            parts.append("   ... and more")
+        text = "".join(parts)
+    except Exception as e:
+        text = f"❌ Error listing DynamoDB tables: {str(e)}"
+    
+    return [TextContent(type="text", text=text)]
+
+async def _handle_create_lf_tags(arguments: Dict[str, Any]) -> List[TextContent]:
+    common = _common(arguments)
+    
+    agent = _get_agent(common.region, common.dry_run)
+    created_tags = await agent.create_lake_formation_tags()
+    
+    parts = [f"🏷️ Lake Formation Tag Definitions Created\n\n", f"🌍 Region: {common.region}\n"]
+    if common.dry_run:
+        parts.append("🔍 Mode: DRY RUN (no actual changes made)\n")
+    parts.append("\n📋 Tag Definitions:\n")
+    
+    for tag_key, tag_values in created_tags.items():
+        parts.append(f"\n🔖 {tag_key}:\n")
+        for value in tag_values:
+            parts.append(f"   • {value}\n")
+    
+    return [TextContent(type="text", text="".join(parts))]
+
+async def _handle_register_s3_with_lakeformation(arguments: Dict[str, Any]) -> List[TextContent]:
+    s3_path = arguments["s3_path"]
+    common = _common(arguments)
+    
+    agent = _get_agent(common.region, common.dry_run)
+    success = await agent.register_s3_location_with_lakeformation(s3_path)
+    
+    if success:
+        parts = [
+            f"✅ Successfully registered S3 location with Lake Formation\n",
+            f"📍 Location: {s3_path}\n",
+            f"🌍 Region: {common.region}\n"
+        ]
+        if common.dry_run:
+            parts.append("🔍 Mode: DRY RUN (no actual changes made)")
+    else:
+        parts = [
+            f"❌ Failed to register S3 location with Lake Formation\n",
+            f"📍 Location: {s3_path}"
+        ]
+    
+    return [TextContent(type="text", text="".join(parts))]
+
+async def _handle_register_table_with_lakeformation(arguments: Dict[str, Any]) -> List[TextContent]:
+    database_name = arguments["database_name"]
+    table_name = arguments["table_name"]
+    common = _common(arguments)
+    
+    agent = _get_agent(common.region, common.dry_run)
+    success = await agent.register_table_with_lakeformation(database_name, table_name)
+    
+    if success:
+        parts = [
+            f"✅ Successfully registered table with Lake Formation\n",
+            f"🗃️ Table: {database_name}.{table_name}\n",
+            f"🌍 Region: {common.region}\n"
+        ]
+        if common.dry_run:
+            parts.append("🔍 Mode: DRY RUN (no actual changes made)")
+    else:
+        parts = [
+            f"❌ Failed to register table with Lake Formation\n",
+            f"🗃️ Table: {database_name}.{table_name}"
+        ]
+    
+    return [TextContent(type="text", text="".join(parts))]
+
+async def _handle_apply_lf_tags(arguments: Dict[str, Any]) -> List[TextContent]:
+    database_name = arguments["database_name"]
+    table_name = arguments["table_name"]
+    column_name = arguments.get("column_name")
+    pii_types = arguments.get("pii_types", [])
+    common = _common(arguments)
+    
+    agent = _get_agent(common.region, common.dry_run)
+    success = await agent.apply_lf_tags_to_resource(
+        database_name, table_name, column_name, pii_types
+    )
+    
+    resource_desc = f"{database_name}.{table_name}"
+    if column_name:
+        resource_desc += f".{column_name}"
+    
+    if success:
+        parts = [
+            f"✅ Successfully applied Lake Formation tags\n",
+            f"🎯 Resource: {resource_desc}\n",
+            f"🏷️ PII Types: {', '.join(pii_types) if pii_types else 'None'}\n",
+            f"🌍 Region: {common.region}\n"
+        ]
+        if common.dry_run:
+            parts.append("🔍 Mode: DRY RUN (no actual changes made)")
+    else:
+        parts = [
+            f"❌ Failed to apply Lake Formation tags\n",
+            f"🎯 Resource: {resource_desc}"
+        ]
+    
+    return [TextContent(type="text", text="".join(parts))]
+
+async def _handle_manage_lake_formation_tags(arguments: Dict[str, Any]) -> List[TextContent]:
+    operation = arguments["operation"]
+    tag_key = arguments.get("tag_key")
+    tag_values = arguments.get("tag_values", [])
+    common = _common(arguments)
+    
+    agent = _get_agent(common.region, common.dry_run)
+    
+    response = await agent.mcp_client.manage_lake_formation_tags(operation, tag_key, tag_values)
+    
+    if response.get('success'):
+        parts = [f"✅ Lake Formation tag {operation} completed\n"]
+        if tag_key:
+            parts.append(f"🏷️ Tag: {tag_key}\n")
+        parts.append(f"🌍 Region: {common.region}\n")
+        if common.dry_run:
+            parts.append("🔍 Mode: DRY RUN")
+        text = "".join(parts)
+    else:
+        text = f"❌ Lake Formation tag {operation} failed: {response.get('error')}"
+    
+    return [TextContent(type="text", text=text)]
+
+async def _handle_register_lake_formation_resources(arguments: Dict[str, Any]) -> List[TextContent]:
+    resource_type = arguments["resource_type"]
+    resource_arn = arguments.get("resource_arn")
+    database_name = arguments.get("database_name")
+    table_name = arguments.get("table_name")
+    common = _common(arguments)
+    
+    agent = _get_agent(common.region, common.dry_run)
+    
+    response = await agent.mcp_client.register_lake_formation_resources(
+        resource_type, resource_arn, database_name, table_name
+    )
+    
+    if response.get('success'):
+        parts = [
+            f"✅ {resource_type.upper()} resource registered with Lake Formation\n",
+            f"🎯 Resource: {resource_arn or f'{database_name}.{table_name}'}\n",
+            f"🌍 Region: {common.region}\n"
+        ]
+        if common.dry_run:
+            parts.append("🔍 Mode: DRY RUN")
+        text = "".join(parts)
+    else:
+        text = f"❌ Resource registration failed: {response.get('error')}"
+    
+    return [TextContent(type="text", text=text)]
+
+async def _handle_apply_lake_formation_tags(arguments: Dict[str, Any]) -> List[TextContent]:
+    database_name = arguments["database_name"]
+    table_name = arguments["table_name"]
+    column_name = arguments.get("column_name")
+    lf_tags = arguments.get("lf_tags", [])
+    common = _common(arguments)
+    
+    agent = _get_agent(common.region, common.dry_run)
+    
+    response = await agent.mcp_client.apply_lake_formation_tags(
+        database_name, table_name, column_name, lf_tags
+    )
+    
+    resource_desc = f"{database_name}.{table_name}"
+    if column_name:
+        resource_desc += f".{column_name}"
+    
+    if response.get('success'):
+        parts = [
+            f"✅ Lake Formation tags applied\n",
+            f"🎯 Resource: {resource_desc}\n",
+            f"🏷️ Tags: {len(lf_tags)} applied\n",
+            f"🌍 Region: {common.region}\n"
+        ]
+        if common.dry_run:
+            parts.append("🔍 Mode: DRY RUN")
+        text = "".join(parts)
+    else:
+        text = f"❌ Tag application failed: {response.get('error')}"
+    
+    return [TextContent(type="text", text=text)]
+
+async def _handle_manage_lake_formation_permissions(arguments: Dict[str, Any]) -> List[TextContent]:
+    operation = arguments["operation"]
+    principal = arguments.get("principal")
+    resource = arguments.get("resource", {})
+    permissions = arguments.get("permissions", [])
+    common = _common(arguments)
+    
+    agent = _get_agent(common.region, common.dry_run)
+    
+    response = await agent.mcp_client.manage_lake_formation_permissions(
+        operation, principal, resource, permissions
+    )
+    
+    if response.get('success'):
+        parts = [f"✅ Lake Formation permissions {operation} completed\n"]
+        if principal:
+            parts.append(f"👤 Principal: {principal}\n")
+        if permissions:
+            parts.append(f"🔐 Permissions: {', '.join(permissions)}\n")
+        parts.append(f"🌍 Region: {common.region}\n")
+        if common.dry_run:
+            parts.append("🔍 Mode: DRY RUN")
+        text = "".join(parts)
+    else:
+        text = f"❌ Permission {operation} failed: {response.get('error')}"
+    
+    return [TextContent(type="text", text=text)]
+
+# Tool name -> handler, resolved with a single dict lookup per call
+_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[List[TextContent]]]] = {
+    "scan_s3_real": _handle_scan_s3_real,
+    "scan_dynamodb_real": _handle_scan_dynamodb_real,
+    "list_s3_buckets": _handle_list_s3_buckets,
+    "list_dynamodb_tables": _handle_list_dynamodb_tables,
+    "create_lf_tags": _handle_create_lf_tags,
+    "register_s3_with_lakeformation": _handle_register_s3_with_lakeformation,
+    "register_table_with_lakeformation": _handle_register_table_with_lakeformation,
+    "apply_lf_tags": _handle_apply_lf_tags,
+    "manage_lake_formation_tags": _handle_manage_lake_formation_tags,
+    "register_lake_formation_resources": _handle_register_lake_formation_resources,
+    "apply_lake_formation_tags": _handle_apply_lake_formation_tags,
+    "manage_lake_formation_permissions": _handle_manage_lake_formation_permissions,
+}
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     try:
-        region = arguments.get("region", "us-west-2")
-        detector = AWSPIIDetector(region)
-        
-        if name == "scan_s3_real":
-            bucket_name = arguments["bucket_name"]
-            max_objects = arguments.get("max_objects", 10)
-            
-            results = await detector.scan_s3_bucket(bucket_name, max_objects)
-            
-            if results:
-                text = f"🔍 S3 PII Scan Results - Bucket: {bucket_name}\n\n"
-                for result in results:
-                    text += f"📄 {result['key']}\n"
-                    text += f"   PII Types: {', '.join(result['pii_types'])}\n"
-                    text += f"   Size: {result['size']} bytes\n\n"
-            else:
-                text = f"✅ No PII found in bucket: {bucket_name}"
-            
-            return [TextContent(type="text", text=text)]
-        
-        elif name == "scan_dynamodb_real":
-            table_name = arguments["table_name"]
-            max_items = arguments.get("max_items", 10)
-            
-            results = await detector.scan_dynamodb_table(table_name, max_items)
-            
-            if results:
-                text = f"🔍 DynamoDB PII Scan Results - Table: {table_name}\n\n"
-                for result in results:
-                    text += f"📊 PII Types: {', '.join(result['pii_types'])}\n"
-                    text += f"   Attributes: {', '.join(result['attributes'])}\n\n"
-            else:
-                text = f"✅ No PII found in table: {table_name}"
-            
-            return [TextContent(type="text", text=text)]
-        
-        elif name == "list_s3_buckets":
-            try:
-                response = detector.s3.list_buckets()
-                buckets = [bucket['Name'] for bucket in response['Buckets']]
-                text = f"📦 S3 Buckets in {region}:\n\n"
-                for bucket in buckets[:20]:  # Limit to 20
-                    text += f"   • {bucket}\n"
-                if len(buckets) > 20:
-                    text += f"   ... and {len(buckets) - 20} more"
-            except Exception as e:
-                text = f"❌ Error listing S3 buckets: {str(e)}"
-            
-            return [TextContent(type="text", text=text)]
-        
-        elif name == "list_dynamodb_tables":
-            try:
-                response = detector.dynamodb.list_tables()
-                tables = response['TableNames']
-                text = f"🗃️ DynamoDB Tables in {region}:\n\n"
-                for table in tables[:20]:  # Limit to 20
-                    text += f"   • {table}\n"
-                if len(tables) > 20:
-                    text += f"   ... and {len(tables) - 20} more"
-            except Exception as e:
-                text = f"❌ Error listing DynamoDB tables: {str(e)}"
-            
-            return [TextContent(type="text", text=text)]
-        
-        elif name == "create_lf_tags":
-            region = arguments.get("region", "us-west-2")
-            dry_run = arguments.get("dry_run", True)
-            
-            config = PIIDetectionConfig(
-                aws_region=region,
-                dry_run=dry_run
-            )
-            
-            agent = AWSPIIDetectionAgent(config)
-            created_tags = await agent.create_lake_formation_tags()
-            
-            text = f"🏷️ Lake Formation Tag Definitions Created\n\n"
-            text += f"🌍 Region: {region}\n"
-            if dry_run:
-                text += "🔍 Mode: DRY RUN (no actual changes made)\n"
-            text += "\n📋 Tag Definitions:\n"
-            
-            for tag_key, tag_values in created_tags.items():
-                text += f"\n🔖 {tag_key}:\n"
-                for value in tag_values:
-                    text += f"   • {value}\n"
-            
-            return [TextContent(type="text", text=text)]
-        
-        elif name == "register_s3_with_lakeformation":
-            s3_path = arguments["s3_path"]
-            region = arguments.get("region", "us-west-2")
-            dry_run = arguments.get("dry_run", True)
-            
-            config = PIIDetectionConfig(
-                aws_region=region,
-                dry_run=dry_run
-            )
-            
-            agent = AWSPIIDetectionAgent(config)
-            success = await agent.register_s3_location_with_lakeformation(s3_path)
-            
-            if success:
-                text = f"✅ Successfully registered S3 location with Lake Formation\n"
-                text += f"📍 Location: {s3_path}\n"
-                text += f"🌍 Region: {region}\n"
-                if dry_run:
-                    text += "🔍 Mode: DRY RUN (no actual changes made)"
-            else:
-                text = f"❌ Failed to register S3 location with Lake Formation\n"
-                text += f"📍 Location: {s3_path}"
-            
-            return [TextContent(type="text", text=text)]
-        
-        elif name == "register_table_with_lakeformation":
-            database_name = arguments["database_name"]
-            table_name = arguments["table_name"]
-            region = arguments.get("region", "us-west-2")
-            dry_run = arguments.get("dry_run", True)
-            
-            config = PIIDetectionConfig(
-                aws_region=region,
-                dry_run=dry_run
-            )
-            
-            agent = AWSPIIDetectionAgent(config)
-            success = await agent.register_table_with_lakeformation(database_name, table_name)
-            
-            if success:
-                text = f"✅ Successfully registered table with Lake Formation\n"
-                text += f"🗃️ Table: {database_name}.{table_name}\n"
-                text += f"🌍 Region: {region}\n"
-                if dry_run:
-                    text += "🔍 Mode: DRY RUN (no actual changes made)"
-            else:
-                text = f"❌ Failed to register table with Lake Formation\n"
-                text += f"🗃️ Table: {database_name}.{table_name}"
-            
-            return [TextContent(type="text", text=text)]
-        
-        elif name == "apply_lf_tags":
-            database_name = arguments["database_name"]
-            table_name = arguments["table_name"]
-            column_name = arguments.get("column_name")
-            pii_types = arguments.get("pii_types", [])
-            region = arguments.get("region", "us-west-2")
-            dry_run = arguments.get("dry_run", True)
-            
-            config = PIIDetectionConfig(
-                aws_region=region,
-                dry_run=dry_run
-            )
-            
-            agent = AWSPIIDetectionAgent(config)
-            success = await agent.apply_lf_tags_to_resource(
-                database_name, table_name, column_name, pii_types
-            )
-            
-            resource_desc = f"{database_name}.{table_name}"
-            if column_name:
-                resource_desc += f".{column_name}"
-            
-            if success:
-                text = f"✅ Successfully applied Lake Formation tags\n"
-                text += f"🎯 Resource: {resource_desc}\n"
-                text += f"🏷️ PII Types: {', '.join(pii_types) if pii_types else 'None'}\n"
-                text += f"🌍 Region: {region}\n"
-                if dry_run:
-                    text += "🔍 Mode: DRY RUN (no actual changes made)"
-            else:
-                text = f"❌ Failed to apply Lake Formation tags\n"
-                text += f"🎯 Resource: {resource_desc}"
-            
-            return [TextContent(type="text", text=text)]
-        
-        elif name == "manage_lake_formation_tags":
-            operation = arguments["operation"]
-            tag_key = arguments.get("tag_key")
-            tag_values = arguments.get("tag_values", [])
-            region = arguments.get("region", "us-west-2")
-            dry_run = arguments.get("dry_run", True)
-            
-            config = PIIDetectionConfig(aws_region=region, dry_run=dry_run)
-            agent = AWSPIIDetectionAgent(config)
-            
-            response = await agent.mcp_client.manage_lake_formation_tags(operation, tag_key, tag_values)
-            
-            if response.get('success'):
-                text = f"✅ Lake Formation tag {operation} completed\n"
-                text += f"🏷️ Tag: {tag_key}\n" if tag_key else ""
-                text += f"🌍 Region: {region}\n"
-                if dry_run:
-                    text += "🔍 Mode: DRY RUN"
-            else:
-                text = f"❌ Lake Formation tag {operation} failed: {response.get('error')}"
-            
-            return [TextContent(type="text", text=text)]
-        
-        elif name == "register_lake_formation_resources":
-            resource_type = arguments["resource_type"]
-            resource_arn = arguments.get("resource_arn")
-            database_name = arguments.get("database_name")
-            table_name = arguments.get("table_name")
-            region = arguments.get("region", "us-west-2")
-            dry_run = arguments.get("dry_run", True)
-            
-            config = PIIDetectionConfig(aws_region=region, dry_run=dry_run)
-            agent = AWSPIIDetectionAgent(config)
-            
-            response = await agent.mcp_client.register_lake_formation_resources(
-                resource_type, resource_arn, database_name, table_name
-            )
-            
-            if response.get('success'):
-                text = f"✅ {resource_type.upper()} resource registered with Lake Formation\n"
-                text += f"🎯 Resource: {resource_arn or f'{database_name}.{table_name}'}\n"
-                text += f"🌍 Region: {region}\n"
-                if dry_run:
-                    text += "🔍 Mode: DRY RUN"
-            else:
-                text = f"❌ Resource registration failed: {response.get('error')}"
-            
-            return [TextContent(type="text", text=text)]
-        
-        elif name == "apply_lake_formation_tags":
-            database_name = arguments["database_name"]
-            table_name = arguments["table_name"]
-            column_name = arguments.get("column_name")
-            lf_tags = arguments.get("lf_tags", [])
-            region = arguments.get("region", "us-west-2")
-            dry_run = arguments.get("dry_run", True)
-            
-            config = PIIDetectionConfig(aws_region=region, dry_run=dry_run)
-            agent = AWSPIIDetectionAgent(config)
-            
-            response = await agent.mcp_client.apply_lake_formation_tags(
-                database_name, table_name, column_name, lf_tags
-            )
-            
-            resource_desc = f"{database_name}.{table_name}"
-            if column_name:
-                resource_desc += f".{column_name}"
-            
-            if response.get('success'):
-                text = f"✅ Lake Formation tags applied\n"
-                text += f"🎯 Resource: {resource_desc}\n"
-                text += f"🏷️ Tags: {len(lf_tags)} applied\n"
-                text += f"🌍 Region: {region}\n"
-                if dry_run:
-                    text += "🔍 Mode: DRY RUN"
-            else:
-                text = f"❌ Tag application failed: {response.get('error')}"
-            
-            return [TextContent(type="text", text=text)]
-        
-        elif name == "manage_lake_formation_permissions":
-            operation = arguments["operation"]
-            principal = arguments.get("principal")
-            resource = arguments.get("resource", {})
-            permissions = arguments.get("permissions", [])
-            region = arguments.get("region", "us-west-2")
-            dry_run = arguments.get("dry_run", True)
-            
-            config = PIIDetectionConfig(aws_region=region, dry_run=dry_run)
-            agent = AWSPIIDetectionAgent(config)
-            
-            response = await agent.mcp_client.manage_lake_formation_permissions(
-                operation, principal, resource, permissions
-            )
-            
-            if response.get('success'):
-                text = f"✅ Lake Formation permissions {operation} completed\n"
-                text += f"👤 Principal: {principal}\n" if principal else ""
-                text += f"🔐 Permissions: {', '.join(permissions)}\n" if permissions else ""
-                text += f"🌍 Region: {region}\n"
-                if dry_run:
-                    text += "🔍 Mode: DRY RUN"
-            else:
-                text = f"❌ Permission {operation} failed: {response.get('error')}"
-            
-            return [TextContent(type="text", text=text)]
-        
-        else:
+        handler = _HANDLERS.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
+        return await handler(arguments)
     
     except Exception as e:
         logger.error(f"Error in tool {name}: {e}")
@@ -8,76 +8,356 @@ import asyncio
 import json
 import logging
 import os
-from typing import Any, Dict, List
+import random
+import re
+import subprocess
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
 from fastmcp import FastMCP
 
+try:
+    import boto3
+    from botocore.config import Config
+except ImportError:
+    boto3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("pii-orchestrator")
 
-mcp = FastMCP("pii-detection-orchestrator")
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Release the orchestrator's pooled AWS connections when the server stops"""
+    try:
+        yield
+    finally:
+        orchestrator.close()
+
+mcp = FastMCP("pii-detection-orchestrator", lifespan=_lifespan)
+
+# Maximum number of resources provisioned or tagged at once; keeps the fan-out
+# well inside the Glue and Lake Formation API rate limits. PII_AWS_CONCURRENCY
+# overrides it for accounts with higher (or lower) quotas
+GLUE_CONCURRENCY = max(1, int(os.getenv('PII_AWS_CONCURRENCY', '10')))
+
+# Maximum crawler names accepted by one Glue BatchGetCrawlers call
+GLUE_BATCH_GET_CRAWLERS_LIMIT = 100
+
+# Connection settings shared by every boto3 client: a pool large enough for
+# the concurrent fan-out, with TCP keep-alive so pooled connections are reused
+_BOTO_CFG = Config(max_pool_connections=GLUE_CONCURRENCY * 2, tcp_keepalive=True) if boto3 else None
+
+# Seconds a discovery snapshot is reused before S3/DynamoDB are listed again
+DISCOVERY_TTL_SECONDS = 30
+
+# Seconds a full discover/catalog/tag run is reused by the workflow tools
+WORKFLOW_TTL_SECONDS = 120
+
+# Port the Streamlit dashboard listens on, and how long to wait for it to come up
+DASHBOARD_PORT = 8501
+DASHBOARD_STARTUP_TIMEOUT = 15
+
+# Read-only MCP tool calls (list-*/get-*/describe-* operations) are answered
+# from a short-lived cache; any other call clears it
+MCP_CACHE_TTL_SECONDS = 60
+MCP_CACHE_MAX_ENTRIES = 1024
+_MCP_READ_OPERATION_RE = re.compile(r'(?:list|get|describe)(?:[-_]|$)')
+
+# Error codes AWS returns when a caller exceeds an API's request rate; calls
+# failing with these are retried with exponential backoff and jitter
+AWS_THROTTLE_CODES = frozenset({
+    'ThrottlingException',
+    'Throttling',
+    'TooManyRequestsException',
+    'RequestLimitExceeded',
+    'ProvisionedThroughputExceededException',
+    'SlowDown',
+})
+AWS_MAX_RETRIES = 5
+AWS_RETRY_BASE_DELAY = 0.2
+
+# Discovery and diagram generation still use boto3/diagrams directly; flip
+# once those paths are wired to the AWS Labs MCP servers
+MCP_INTEGRATION_READY = False
+
+# Glue database shared by every DynamoDB table crawler
+DYNAMODB_CATALOG_DB = 'dynamodb_catalog'
+
+# Characters S3 allows in bucket names that Glue database names don't
+_GLUE_NAME_TABLE = str.maketrans('-', '_')
+
+@lru_cache(maxsize=1024)
+def _s3_catalog_names(bucket: str) -> Tuple[str, str]:
+    """Glue database and crawler names for an S3 bucket, derived once per bucket"""
+    return f"{bucket.translate(_GLUE_NAME_TABLE)}_db", f"{bucket}-crawler"
+
+def _dynamodb_crawler_name(table: str) -> str:
+    """Glue crawler name for a DynamoDB table"""
+    return f"{table}-dynamodb-crawler"
+
+# Resource-name keywords and the PII types they imply, in reporting order
+PII_NAME_KEYWORDS = (
+    (("user", "customer", "profile", "person"), ("EMAIL", "PHONE", "NAME")),
+    (("transaction", "payment", "billing"), ("CREDIT_CARD", "SSN")),
+    (("medical", "health", "patient"), ("MEDICAL_RECORD", "SSN")),
+    (("employee", "hr", "payroll"), ("SSN", "SALARY", "NAME")),
+)
+# One pass over the name finds every keyword group; the lookahead lets matches
+# overlap (e.g. "hr" inside "healthrecords") so no group is hidden by another.
+# Keywords are substrings rather than tokens because bucket and table names
+# are often run together ("userprofiles")
+_PII_NAME_RE = re.compile('(?=' + '|'.join(
+    f'(?P<g{index}>' + '|'.join(map(re.escape, keywords)) + ')'
+    for index, (keywords, _) in enumerate(PII_NAME_KEYWORDS)
+) + ')', re.IGNORECASE)
+_PII_NAME_GROUPS = tuple((f'g{index}', types) for index, (_, types) in enumerate(PII_NAME_KEYWORDS))
+
+def _pii_types_for_name(name: str) -> List[str]:
+    """PII types suggested by a resource name, grouped in PII_NAME_KEYWORDS order"""
+    groups = {match.lastgroup for match in _PII_NAME_RE.finditer(name)}
+    pii_types = []
+    for group, types in _PII_NAME_GROUPS:
+        if group in groups:
+            pii_types.extend(types)
+    return pii_types
+
+# AWS Labs MCP servers the orchestrator can delegate to
+MCP_SERVER_PACKAGES = (
+    '@awslabs/s3-tables-mcp-server',
+    '@awslabs/dynamodb-mcp-server',
+    '@awslabs/aws-dataprocessing-mcp-server',
+    '@awslabs/aws-diagram-mcp-server',
+)
+
+def _probe_mcp_servers() -> Dict[str, bool]:
+    """Work out which AWS Labs MCP servers are installed without running npm list"""
+    configured = os.getenv('PII_MCP_SERVERS')
+    if configured is not None:
+        # Comma-separated package names; lets deployments skip the probe entirely
+        enabled = {name.strip() for name in configured.split(',') if name.strip()}
+        return {package: package in enabled for package in MCP_SERVER_PACKAGES}
+    
+    prefix = os.getenv('NPM_CONFIG_PREFIX')
+    if not prefix:
+        try:
+            prefix = subprocess.run(['npm', 'prefix', '-g'], capture_output=True, text=True).stdout.strip()
+        except OSError:
+            prefix = ''
+    if not prefix:
+        return {package: False for package in MCP_SERVER_PACKAGES}
+    
+    # Global packages live in lib/node_modules on POSIX and node_modules on Windows
+    module_dirs = [os.path.join(prefix, 'lib', 'node_modules'), os.path.join(prefix, 'node_modules')]
+    return {
+        package: any(os.path.isdir(os.path.join(module_dir, package)) for module_dir in module_dirs)
+        for package in MCP_SERVER_PACKAGES
+    }
+
+MCP_AVAILABLE = _probe_mcp_servers()
+
+def _to_json(payload: Any) -> str:
+    """Serialize an MCP payload as compact JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload, separators=(',', ':'))
+
+def _to_json_file(payload: Any) -> bytes:
+    """Serialize a payload as indented JSON for files people may inspect"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, default=str).encode()
+
+def _is_read_only_mcp_call(params: Dict) -> bool:
+    """True for MCP calls whose 'operation' only reads, e.g. list-databases"""
+    operation = params.get('operation')
+    return isinstance(operation, str) and _MCP_READ_OPERATION_RE.match(operation) is not None
+
+def _collect_results(results: List, error_message: str) -> List:
+    """Drop and log the failures from an asyncio.gather(..., return_exceptions=True)"""
+    collected = []
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"{error_message}: {result}")
+        else:
+            collected.append(result)
+    return collected
+
+@dataclass
+class CatalogEntry:
+    """Outcome of cataloging one data source; reads like the dict it replaces"""
+    __slots__ = ('type', 'name', 'status', 'database', 'crawler_name', 'crawler_status', 'error')
+    type: str
+    name: str
+    status: str
+    database: str
+    crawler_name: Optional[str]
+    crawler_status: Optional[str]
+    error: Optional[str]
+    
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+    
+    def get(self, key: str, default: Any = None):
+        return getattr(self, key, default)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for JSON output, leaving out unset fields"""
+        return {f.name: getattr(self, f.name) for f in fields(self) if getattr(self, f.name) is not None}
 
 class MCPOrchestrator:
     def __init__(self):
         self.aws_region = os.getenv('AWS_REGION', 'us-west-2')
+        self._session = boto3.session.Session() if boto3 else None
+        self._clients: Dict[Tuple[str, str], Any] = {}
+        self._account_id: Optional[str] = None
+        self._account_id_lookup: Optional[asyncio.Future] = None
+        self._lf_tag_regions: Set[str] = set()
+        self._sources_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._sources_inflight: Dict[str, asyncio.Future] = {}
+        self._mcp_cache: Dict[str, Tuple[float, Any]] = {}
+        self._workflow_cache: Dict[str, Tuple[float, Tuple[Dict, List, List]]] = {}
+        self._workflow_inflight: Dict[str, asyncio.Future] = {}
         logger.info(f"Initialized orchestrator for region: {self.aws_region}")
     
-    async def discover_data_sources(self):
+    def _client(self, service: str, region: Optional[str] = None):
+        """Return a boto3 client for the region (default: current), created once and reused"""
+        region = region or self.aws_region
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            if boto3 is None:
+                raise RuntimeError("boto3 is not installed")
+            client = self._clients[key] = self._session.client(service, region_name=region, config=_BOTO_CFG)
+        return client
+    
+    def close(self):
+        """Close every cached client and its connection pool"""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            client.close()
+    
+    async def _aws_call(self, service: str, operation: str, region: Optional[str] = None, **kwargs):
+        """Run a blocking boto3 call in a worker thread so the event loop stays free.
+        
+        Throttled calls are retried with exponential backoff and jitter.
+        """
+        method = getattr(self._client(service, region), operation)
+        return await self._run_throttled(f"{service}.{operation}", method, **kwargs)
+    
+    async def _aws_paginate(self, service: str, operation: str, result_key: str, region: Optional[str] = None, **kwargs):
+        """Collect result_key from every page of a listing in a worker thread"""
+        client = self._client(service, region)
+        
+        def collect():
+            if not client.can_paginate(operation):
+                return getattr(client, operation)(**kwargs).get(result_key, [])
+            items = []
+            for page in client.get_paginator(operation).paginate(**kwargs):
+                items.extend(page.get(result_key, ()))
+            return items
+        
+        return await self._run_throttled(f"{service}.{operation}", collect)
+    
+    async def _run_throttled(self, label: str, func, **kwargs):
+        """Run func in a worker thread, retrying throttling errors with backoff and jitter"""
+        for attempt in range(AWS_MAX_RETRIES + 1):
+            try:
+                return await asyncio.to_thread(func, **kwargs)
+            except Exception as e:
+                code = getattr(e, 'response', {}).get('Error', {}).get('Code')
+                if code not in AWS_THROTTLE_CODES or attempt == AWS_MAX_RETRIES:
+                    raise
+                delay = AWS_RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, AWS_RETRY_BASE_DELAY)
+                logger.warning(f"{label} throttled ({code}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+    
+    async def discover_data_sources(self, refresh: bool = False):
+        """Discover S3 buckets and DynamoDB tables, reusing a recent snapshot for the region"""
+        region = self.aws_region
+        cached = self._sources_cache.get(region)
+        if cached and not refresh and time.monotonic() - cached[0] < DISCOVERY_TTL_SECONDS:
+            return cached[1]
+        
+        # Concurrent callers for the same region share one in-flight discovery
+        inflight = self._sources_inflight.get(region)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._discover_data_sources(region))
+            self._sources_inflight[region] = inflight
+            inflight.add_done_callback(lambda _: self._sources_inflight.pop(region, None))
+        return await asyncio.shield(inflight)
+    
+    async def run_full_workflow(self, refresh: bool = False) -> Tuple[Dict, List, List]:
+        """Discover, catalog and tag the region's data sources, reusing a recent run.
+        
+        Returns (sources, catalog_results, pii_results).
+        """
+        region = self.aws_region
+        cached = self._workflow_cache.get(region)
+        if cached and not refresh and time.monotonic() - cached[0] < WORKFLOW_TTL_SECONDS:
+            return cached[1]
+        
+        # Concurrent callers for the same region share one in-flight run
+        inflight = self._workflow_inflight.get(region)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._run_full_workflow(region, refresh))
+            self._workflow_inflight[region] = inflight
+            inflight.add_done_callback(lambda _: self._workflow_inflight.pop(region, None))
+        return await asyncio.shield(inflight)
+    
+    async def _run_full_workflow(self, region: str, refresh: bool):
+        sources = await self.discover_data_sources(refresh=refresh)
+        catalog_results = await self.catalog_data_with_glue(sources)
+        pii_results = await self.detect_and_tag_pii(catalog_results)
+        
+        workflow = (sources, catalog_results, pii_results)
+        self._workflow_cache[region] = (time.monotonic(), workflow)
+        return workflow
+    
+    async def _discover_data_sources(self, region: str):
         """Discover S3 buckets and DynamoDB tables using AWS Labs MCP servers with boto3 fallback"""
         sources = {"s3_buckets": [], "dynamodb_tables": []}
         
         try:
-            # Try AWS Labs MCP servers first
-            try:
-                # Check if AWS Labs MCP servers are available
-                import subprocess
-                s3_mcp_available = subprocess.run(
-                    ['npm', 'list', '-g', '@awslabs/s3-tables-mcp-server'],
-                    capture_output=True, text=True
-                ).returncode == 0
-                
-                dynamodb_mcp_available = subprocess.run(
-                    ['npm', 'list', '-g', '@awslabs/dynamodb-mcp-server'],
-                    capture_output=True, text=True
-                ).returncode == 0
-                
-                if s3_mcp_available or dynamodb_mcp_available:
-                    logger.info("AWS Labs MCP servers detected, using MCP integration")
-                    # Use MCP server calls here
-                    # For now, fall back to boto3 until full MCP integration
-                    raise Exception("MCP integration in progress")
-                    
-            except Exception as mcp_error:
-                logger.info(f"AWS Labs MCP servers not available ({mcp_error}), using boto3 fallback")
+            # AWS Labs MCP servers are used once the integration is ready
+            use_mcp = MCP_AVAILABLE['@awslabs/s3-tables-mcp-server'] or MCP_AVAILABLE['@awslabs/dynamodb-mcp-server']
+            if use_mcp and not MCP_INTEGRATION_READY:
+                logger.info("AWS Labs MCP servers detected, MCP integration in progress; using boto3 fallback")
+            elif not use_mcp:
+                logger.info("AWS Labs MCP servers not available, using boto3 fallback")
             
-            # Boto3 fallback implementation
-            import boto3
+            # Boto3 fallback implementation; the two listings are independent,
+            # so run them concurrently (ListTables returns at most 100 names per page)
+            buckets, tables = await asyncio.gather(
+                self._aws_paginate('s3', 'list_buckets', 'Buckets', region),
+                self._aws_paginate('dynamodb', 'list_tables', 'TableNames', region),
+                return_exceptions=True
+            )
             
             # Discover S3 buckets
-            try:
-                s3_client = boto3.client('s3', region_name=self.aws_region)
-                response = s3_client.list_buckets()
-                sources["s3_buckets"] = [bucket['Name'] for bucket in response.get('Buckets', [])]
-                logger.info(f"Discovered {len(sources['s3_buckets'])} S3 buckets via boto3")
-            except Exception as e:
-                logger.warning(f"Could not list S3 buckets via boto3: {e}")
+            if isinstance(buckets, Exception):
+                logger.warning(f"Could not list S3 buckets via boto3: {buckets}")
                 sources["s3_buckets"] = ["data-lake-raw", "analytics-processed", "pii-quarantine"]
+            else:
+                sources["s3_buckets"] = [bucket['Name'] for bucket in buckets]
+                logger.info(f"Discovered {len(sources['s3_buckets'])} S3 buckets via boto3")
             
             # Discover DynamoDB tables
-            try:
-                dynamodb_client = boto3.client('dynamodb', region_name=self.aws_region)
-                response = dynamodb_client.list_tables()
-                sources["dynamodb_tables"] = response.get('TableNames', [])
-                logger.info(f"Discovered {len(sources['dynamodb_tables'])} DynamoDB tables via boto3")
-            except Exception as e:
-                logger.warning(f"Could not list DynamoDB tables via boto3: {e}")
+            if isinstance(tables, Exception):
+                logger.warning(f"Could not list DynamoDB tables via boto3: {tables}")
                 sources["dynamodb_tables"] = ["user-profiles", "transaction-logs", "audit-trail"]
+            else:
+                sources["dynamodb_tables"] = tables
+                logger.info(f"Discovered {len(sources['dynamodb_tables'])} DynamoDB tables via boto3")
                 
-        except ImportError:
-            logger.warning("boto3 not available, using mock data")
-            sources = {
-                "s3_buckets": ["data-lake-raw", "analytics-processed", "pii-quarantine"],
-                "dynamodb_tables": ["user-profiles", "transaction-logs", "audit-trail"]
-            }
         except Exception as e:
             logger.error(f"Error discovering data sources: {e}")
             sources = {
@@ -85,6 +365,7 @@ class MCPOrchestrator:
                 "dynamodb_tables": ["user-profiles", "transaction-logs", "audit-trail"]
             }
         
+        self._sources_cache[region] = (time.monotonic(), sources)
         return sources
     
     async def catalog_data_with_glue(self, sources: Dict):
@@ -94,11 +375,7 @@ class MCPOrchestrator:
         try:
             # Try AWS Labs DataProcessing MCP server first
             try:
-                import subprocess
-                dataprocessing_mcp_available = subprocess.run(
-                    ['npm', 'list', '-g', '@awslabs/aws-dataprocessing-mcp-server'],
-                    capture_output=True, text=True
-                ).returncode == 0
+                dataprocessing_mcp_available = MCP_AVAILABLE['@awslabs/aws-dataprocessing-mcp-server']
                 
                 if dataprocessing_mcp_available:
                     logger.info("Using AWS Labs DataProcessing MCP server for Glue crawlers")
@@ -116,247 +393,286 @@ class MCPOrchestrator:
     
     async def _catalog_with_dataprocessing_mcp(self, sources: Dict):
         """Catalog using AWS Labs DataProcessing MCP server with actual Glue crawlers"""
-        catalog_results = []
-        
         try:
-            # 1. Create Glue databases
-            for bucket in sources["s3_buckets"]:
-                db_name = f"{bucket.replace('-', '_')}_db"
-                await self._call_mcp_tool('dataprocessing', 'manage_aws_glue_databases', {
-                    'operation': 'create-database',
-                    'database_name': db_name,
-                    'description': f'Database for S3 bucket {bucket}'
-                })
-                logger.info(f"Created Glue database: {db_name}")
+            # Buckets and tables are provisioned independently, so fan them out
+            semaphore = asyncio.Semaphore(GLUE_CONCURRENCY)
+            s3_results, dynamodb_results = await asyncio.gather(
+                asyncio.gather(
+                    *[self._provision_s3_via_mcp(semaphore, bucket) for bucket in sources["s3_buckets"]],
+                    return_exceptions=True
+                ),
+                self._provision_dynamodb_via_mcp(semaphore, sources["dynamodb_tables"])
+            )
+            catalog_results = _collect_results(s3_results + dynamodb_results, "Error using DataProcessing MCP server")
+            
+            logger.info(f"Created and started {len(catalog_results)} Glue crawlers")
+            return catalog_results
+            
+        except Exception as e:
+            logger.error(f"Error using DataProcessing MCP server: {e}")
+            return []
+    
+    async def _provision_s3_via_mcp(self, semaphore: asyncio.Semaphore, bucket: str):
+        """Create the Glue database and crawler for one bucket via MCP and start it"""
+        db_name, crawler_name = _s3_catalog_names(bucket)
+        
+        async with semaphore:
+            await self._call_mcp_tool('dataprocessing', 'manage_aws_glue_databases', {
+                'operation': 'create-database',
+                'database_name': db_name,
+                'description': f'Database for S3 bucket {bucket}'
+            })
+            logger.info(f"Created Glue database: {db_name}")
+            
+            # Create S3 crawler
+            await self._call_mcp_tool('dataprocessing', 'create_glue_crawler', {
+                'crawler_name': crawler_name,
+                'database_name': db_name,
+                's3_targets': [f's3://{bucket}/'],
+                'role_arn': f'arn:aws:iam::{await self._get_account_id()}:role/GlueServiceRole'
+            })
+            logger.info(f"Created S3 crawler: {crawler_name}")
+            
+            # Run crawler
+            await self._call_mcp_tool('dataprocessing', 'start_glue_crawler', {
+                'crawler_name': crawler_name
+            })
+            logger.info(f"Started S3 crawler: {crawler_name}")
             
-            # Create DynamoDB catalog database
+            # Verify crawler status
+            status = await self._call_mcp_tool('dataprocessing', 'get_glue_crawler_status', {
+                'crawler_name': crawler_name
+            })
+        
+        return CatalogEntry(
+            "s3", bucket, "crawler_running" if status.get('state') == 'RUNNING' else "cataloged",
+            db_name, crawler_name, status.get('state', 'UNKNOWN'), None
+        )
+    
+    async def _provision_dynamodb_via_mcp(self, semaphore: asyncio.Semaphore, tables: List[str]):
+        """Create the shared DynamoDB catalog database via MCP, then one crawler per table"""
+        async with semaphore:
             await self._call_mcp_tool('dataprocessing', 'manage_aws_glue_databases', {
                 'operation': 'create-database',
-                'database_name': 'dynamodb_catalog',
+                'database_name': DYNAMODB_CATALOG_DB,
                 'description': 'Database for DynamoDB tables'
             })
+        
+        return await asyncio.gather(
+            *[self._provision_dynamodb_table_via_mcp(semaphore, table) for table in tables],
+            return_exceptions=True
+        )
+    
+    async def _provision_dynamodb_table_via_mcp(self, semaphore: asyncio.Semaphore, table: str):
+        """Create and start the Glue crawler for one DynamoDB table via MCP"""
+        crawler_name = _dynamodb_crawler_name(table)
+        
+        async with semaphore:
+            # Create DynamoDB crawler
+            await self._call_mcp_tool('dataprocessing', 'create_glue_crawler', {
+                'crawler_name': crawler_name,
+                'database_name': DYNAMODB_CATALOG_DB,
+                'dynamodb_targets': [{
+                    'path': table,
+                    'scan_all': True
+                }],
+                'role_arn': f'arn:aws:iam::{await self._get_account_id()}:role/GlueServiceRole'
+            })
+            logger.info(f"Created DynamoDB crawler: {crawler_name}")
             
-            # 2. Create and run S3 crawlers
-            for bucket in sources["s3_buckets"]:
-                db_name = f"{bucket.replace('-', '_')}_db"
-                crawler_name = f"{bucket}-crawler"
-                
-                # Create S3 crawler
-                await self._call_mcp_tool('dataprocessing', 'create_glue_crawler', {
-                    'crawler_name': crawler_name,
-                    'database_name': db_name,
-                    's3_targets': [f's3://{bucket}/'],
-                    'role_arn': f'arn:aws:iam::{self._get_account_id()}:role/GlueServiceRole'
-                })
-                logger.info(f"Created S3 crawler: {crawler_name}")
-                
-                # Run crawler
-                await self._call_mcp_tool('dataprocessing', 'start_glue_crawler', {
-                    'crawler_name': crawler_name
-                })
-                logger.info(f"Started S3 crawler: {crawler_name}")
-                
-                # Verify crawler status
-                status = await self._call_mcp_tool('dataprocessing', 'get_glue_crawler_status', {
-                    'crawler_name': crawler_name
-                })
-                
-                catalog_results.append({
-                    "type": "s3",
-                    "name": bucket,
-                    "status": "crawler_running" if status.get('state') == 'RUNNING' else "cataloged",
-                    "database": db_name,
-                    "crawler_name": crawler_name,
-                    "crawler_status": status.get('state', 'UNKNOWN')
-                })
+            # Run crawler
+            await self._call_mcp_tool('dataprocessing', 'start_glue_crawler', {
+                'crawler_name': crawler_name
+            })
+            logger.info(f"Started DynamoDB crawler: {crawler_name}")
             
-            # 3. Create and run DynamoDB crawlers
-            for table in sources["dynamodb_tables"]:
-                crawler_name = f"{table}-dynamodb-crawler"
-                
-                # Create DynamoDB crawler
-                await self._call_mcp_tool('dataprocessing', 'create_glue_crawler', {
-                    'crawler_name': crawler_name,
-                    'database_name': 'dynamodb_catalog',
-                    'dynamodb_targets': [{
-                        'path': table,
-                        'scan_all': True
-                    }],
-                    'role_arn': f'arn:aws:iam::{self._get_account_id()}:role/GlueServiceRole'
-                })
-                logger.info(f"Created DynamoDB crawler: {crawler_name}")
-                
-                # Run crawler
-                await self._call_mcp_tool('dataprocessing', 'start_glue_crawler', {
-                    'crawler_name': crawler_name
-                })
-                logger.info(f"Started DynamoDB crawler: {crawler_name}")
-                
-                # Verify crawler status
-                status = await self._call_mcp_tool('dataprocessing', 'get_glue_crawler_status', {
-                    'crawler_name': crawler_name
-                })
-                
-                catalog_results.append({
-                    "type": "dynamodb",
-                    "name": table,
-                    "status": "crawler_running" if status.get('state') == 'RUNNING' else "cataloged",
-                    "database": "dynamodb_catalog",
-                    "crawler_name": crawler_name,
-                    "crawler_status": status.get('state', 'UNKNOWN')
-                })
+            # Verify crawler status
+            status = await self._call_mcp_tool('dataprocessing', 'get_glue_crawler_status', {
+                'crawler_name': crawler_name
+            })
+        
+        return CatalogEntry(
+            "dynamodb", table, "crawler_running" if status.get('state') == 'RUNNING' else "cataloged",
+            DYNAMODB_CATALOG_DB, crawler_name, status.get('state', 'UNKNOWN'), None
+        )
+    
+    async def _catalog_with_boto3_crawlers(self, sources: Dict):
+        """Catalog using boto3 with actual Glue crawlers as fallback"""
+        try:
+            # Buckets and tables are provisioned independently, so fan them out
+            semaphore = asyncio.Semaphore(GLUE_CONCURRENCY)
+            s3_results, dynamodb_results = await asyncio.gather(
+                asyncio.gather(
+                    *[self._provision_s3_via_boto3(semaphore, bucket) for bucket in sources["s3_buckets"]],
+                    return_exceptions=True
+                ),
+                self._provision_dynamodb_via_boto3(semaphore, sources["dynamodb_tables"])
+            )
+            catalog_results = _collect_results(s3_results + dynamodb_results, "Error using boto3 crawlers")
             
-            logger.info(f"Created and started {len(catalog_results)} Glue crawlers")
+            # Read back every started crawler's state in batched calls instead of one get_crawler each
+            started = [result for result in catalog_results if result.status != "error"]
+            states = await self._get_crawler_states([result.crawler_name for result in started])
+            for result in started:
+                crawler_status = states.get(result.crawler_name, 'UNKNOWN')
+                result.status = "crawler_running" if crawler_status == 'RUNNING' else "cataloged"
+                result.crawler_status = crawler_status
+            
+            logger.info(f"Created and started {len(catalog_results)} Glue crawlers via boto3")
             return catalog_results
             
         except Exception as e:
-            logger.error(f"Error using DataProcessing MCP server: {e}")
+            logger.error(f"Error using boto3 crawlers: {e}")
             return []
     
-    async def _catalog_with_boto3_crawlers(self, sources: Dict):
-        """Catalog using boto3 with actual Glue crawlers as fallback"""
-        catalog_results = []
+    async def _get_crawler_states(self, crawler_names: List[str]) -> Dict[str, str]:
+        """Fetch crawler states with BatchGetCrawlers, which accepts up to 100 names per call"""
+        batches = [
+            crawler_names[start:start + GLUE_BATCH_GET_CRAWLERS_LIMIT]
+            for start in range(0, len(crawler_names), GLUE_BATCH_GET_CRAWLERS_LIMIT)
+        ]
+        responses = await asyncio.gather(
+            *[self._aws_call('glue', 'batch_get_crawlers', CrawlerNames=batch) for batch in batches],
+            return_exceptions=True
+        )
         
+        states = {}
+        for response in _collect_results(responses, "Error getting crawler status"):
+            for crawler in response.get('Crawlers', []):
+                states[crawler['Name']] = crawler['State']
+        return states
+    
+    async def _create_glue_database_boto3(self, db_name: str, description: str):
+        """Create a Glue database, treating an existing one as success"""
         try:
-            import boto3
-            glue_client = boto3.client('glue', region_name=self.aws_region)
-            
-            # 1. Create Glue databases
-            for bucket in sources["s3_buckets"]:
-                db_name = f"{bucket.replace('-', '_')}_db"
-                try:
-                    glue_client.create_database(
-                        DatabaseInput={
-                            'Name': db_name,
-                            'Description': f'Database for S3 bucket {bucket}'
-                        }
-                    )
-                    logger.info(f"Created Glue database: {db_name}")
-                except Exception as e:
-                    if "AlreadyExistsException" not in str(e):
-                        logger.warning(f"Error creating database {db_name}: {e}")
+            await self._aws_call(
+                'glue', 'create_database',
+                DatabaseInput={
+                    'Name': db_name,
+                    'Description': description
+                }
+            )
+            logger.info(f"Created Glue database: {db_name}")
+        except Exception as e:
+            if "AlreadyExistsException" not in str(e):
+                logger.warning(f"Error creating database {db_name}: {e}")
+    
+    async def _provision_s3_via_boto3(self, semaphore: asyncio.Semaphore, bucket: str):
+        """Create the Glue database and crawler for one bucket and start it"""
+        db_name, crawler_name = _s3_catalog_names(bucket)
+        
+        async with semaphore:
+            await self._create_glue_database_boto3(db_name, f'Database for S3 bucket {bucket}')
             
-            # Create DynamoDB catalog database
             try:
-                glue_client.create_database(
-                    DatabaseInput={
-                        'Name': 'dynamodb_catalog',
-                        'Description': 'Database for DynamoDB tables'
+                # Create S3 crawler
+                await self._aws_call(
+                    'glue', 'create_crawler',
+                    Name=crawler_name,
+                    Role=f'arn:aws:iam::{await self._get_account_id()}:role/GlueServiceRole',
+                    DatabaseName=db_name,
+                    Targets={
+                        'S3Targets': [{
+                            'Path': f's3://{bucket}/'
+                        }]
                     }
                 )
+                logger.info(f"Created S3 crawler: {crawler_name}")
+                
+                # Start crawler
+                await self._aws_call('glue', 'start_crawler', Name=crawler_name)
+                logger.info(f"Started S3 crawler: {crawler_name}")
+                
+                return CatalogEntry("s3", bucket, "started", db_name, crawler_name, None, None)
+                
             except Exception as e:
-                if "AlreadyExistsException" not in str(e):
-                    logger.warning(f"Error creating DynamoDB database: {e}")
-            
-            # 2. Create and run S3 crawlers
-            for bucket in sources["s3_buckets"]:
-                db_name = f"{bucket.replace('-', '_')}_db"
-                crawler_name = f"{bucket}-crawler"
+                logger.error(f"Error with S3 crawler {crawler_name}: {e}")
+                return CatalogEntry("s3", bucket, "error", db_name, None, None, str(e))
+    
+    async def _provision_dynamodb_via_boto3(self, semaphore: asyncio.Semaphore, tables: List[str]):
+        """Create the shared DynamoDB catalog database, then one crawler per table"""
+        async with semaphore:
+            await self._create_glue_database_boto3(DYNAMODB_CATALOG_DB, 'Database for DynamoDB tables')
+        
+        return await asyncio.gather(
+            *[self._provision_dynamodb_table_via_boto3(semaphore, table) for table in tables],
+            return_exceptions=True
+        )
+    
+    async def _provision_dynamodb_table_via_boto3(self, semaphore: asyncio.Semaphore, table: str):
+        """Create and start the Glue crawler for one DynamoDB table"""
+        crawler_name = _dynamodb_crawler_name(table)
+        
+        async with semaphore:
+            try:
+                # Create DynamoDB crawler
+                await self._aws_call(
+                    'glue', 'create_crawler',
+                    Name=crawler_name,
+                    Role=f'arn:aws:iam::{await self._get_account_id()}:role/GlueServiceRole',
+                    DatabaseName=DYNAMODB_CATALOG_DB,
+                    Targets={
+                        'DynamoDBTargets': [{
+                            'Path': table,
+                            'scanAll': True
+                        }]
+                    }
+                )
+                logger.info(f"Created DynamoDB crawler: {crawler_name}")
                 
-                try:
-                    # Create S3 crawler
-                    glue_client.create_crawler(
-                        Name=crawler_name,
-                        Role=f'arn:aws:iam::{self._get_account_id()}:role/GlueServiceRole',
-                        DatabaseName=db_name,
-                        Targets={
-                            'S3Targets': [{
-                                'Path': f's3://{bucket}/'
-                            }]
-                        }
-                    )
-                    logger.info(f"Created S3 crawler: {crawler_name}")
-                    
-                    # Start crawler
-                    glue_client.start_crawler(Name=crawler_name)
-                    logger.info(f"Started S3 crawler: {crawler_name}")
-                    
-                    # Get crawler status
-                    response = glue_client.get_crawler(Name=crawler_name)
-                    crawler_status = response['Crawler']['State']
-                    
-                    catalog_results.append({
-                        "type": "s3",
-                        "name": bucket,
-                        "status": "crawler_running" if crawler_status == 'RUNNING' else "cataloged",
-                        "database": db_name,
-                        "crawler_name": crawler_name,
-                        "crawler_status": crawler_status
-                    })
-                    
-                except Exception as e:
-                    logger.error(f"Error with S3 crawler {crawler_name}: {e}")
-                    catalog_results.append({
-                        "type": "s3",
-                        "name": bucket,
-                        "status": "error",
-                        "database": db_name,
-                        "error": str(e)
-                    })
-            
-            # 3. Create and run DynamoDB crawlers
-            for table in sources["dynamodb_tables"]:
-                crawler_name = f"{table}-dynamodb-crawler"
+                # Start crawler
+                await self._aws_call('glue', 'start_crawler', Name=crawler_name)
+                logger.info(f"Started DynamoDB crawler: {crawler_name}")
                 
-                try:
-                    # Create DynamoDB crawler
-                    glue_client.create_crawler(
-                        Name=crawler_name,
-                        Role=f'arn:aws:iam::{self._get_account_id()}:role/GlueServiceRole',
-                        DatabaseName='dynamodb_catalog',
-                        Targets={
-                            'DynamoDBTargets': [{
-                                'Path': table,
-                                'scanAll': True
-                            }]
-                        }
-                    )
-                    logger.info(f"Created DynamoDB crawler: {crawler_name}")
-                    
-                    # Start crawler
-                    glue_client.start_crawler(Name=crawler_name)
-                    logger.info(f"Started DynamoDB crawler: {crawler_name}")
-                    
-                    # Get crawler status
-                    response = glue_client.get_crawler(Name=crawler_name)
-                    crawler_status = response['Crawler']['State']
-                    
-                    catalog_results.append({
-                        "type": "dynamodb",
-                        "name": table,
-                        "status": "crawler_running" if crawler_status == 'RUNNING' else "cataloged",
-                        "database": "dynamodb_catalog",
-                        "crawler_name": crawler_name,
-                        "crawler_status": crawler_status
-                    })
-                    
-                except Exception as e:
-                    logger.error(f"Error with DynamoDB crawler {crawler_name}: {e}")
-                    catalog_results.append({
-                        "type": "dynamodb",
-                        "name": table,
-                        "status": "error",
-                        "database": "dynamodb_catalog",
-                        "error": str(e)
-                    })
-            
-            logger.info(f"Created and started {len(catalog_results)} Glue crawlers via boto3")
-            return catalog_results
-            
-        except Exception as e:
-            logger.error(f"Error using boto3 crawlers: {e}")
-            return []
+                return CatalogEntry("dynamodb", table, "started", DYNAMODB_CATALOG_DB, crawler_name, None, None)
+                
+            except Exception as e:
+                logger.error(f"Error with DynamoDB crawler {crawler_name}: {e}")
+                return CatalogEntry("dynamodb", table, "error", DYNAMODB_CATALOG_DB, None, None, str(e))
     
-    def _get_account_id(self):
-        """Get AWS account ID"""
+    async def _get_account_id(self):
+        """Get AWS account ID, looked up once and then reused"""
+        if self._account_id is not None:
+            return self._account_id
+        
+        # Concurrent first callers share a single STS request
+        if self._account_id_lookup is None:
+            self._account_id_lookup = asyncio.ensure_future(self._aws_call('sts', 'get_caller_identity'))
+        lookup = self._account_id_lookup
         try:
-            import boto3
-            sts_client = boto3.client('sts')
-            return sts_client.get_caller_identity()['Account']
+            identity = await asyncio.shield(lookup)
+            self._account_id = identity['Account']
+            return self._account_id
         except Exception:
+            # Leave the next call free to retry the lookup
+            if self._account_id_lookup is lookup:
+                self._account_id_lookup = None
             return "123456789012"  # Mock account ID
     
     async def _call_mcp_tool(self, server_type: str, tool_name: str, params: Dict):
+        """Call an AWS Labs MCP server tool, reusing recent results of read-only operations"""
+        if not _is_read_only_mcp_call(params):
+            # Anything that may change state makes earlier reads stale
+            self._mcp_cache.clear()
+            return await self._invoke_mcp_tool(server_type, tool_name, params)
+        
+        key = f"{server_type}:{tool_name}:{json.dumps(params, sort_keys=True, default=str)}"
+        cached = self._mcp_cache.get(key)
+        if cached and time.monotonic() - cached[0] < MCP_CACHE_TTL_SECONDS:
+            return cached[1]
+        
+        result = await self._invoke_mcp_tool(server_type, tool_name, params)
+        if result.get('status') != 'error':
+            if len(self._mcp_cache) >= MCP_CACHE_MAX_ENTRIES:
+                self._mcp_cache.clear()
+            self._mcp_cache[key] = (time.monotonic(), result)
+        return result
+    
+    def invalidate_mcp_cache(self):
+        """Forget cached MCP read results so the next calls go to the servers"""
+        self._mcp_cache.clear()
+    
+    async def _invoke_mcp_tool(self, server_type: str, tool_name: str, params: Dict):
         """Call AWS Labs DataProcessing MCP server tool"""
         try:
             # This would be the actual MCP protocol call to DataProcessing server
@@ -389,97 +705,68 @@ class MCPOrchestrator:
             # 1. Create Lake Formation tags first
             await _create_lf_tags_via_mcp()
             
-            # 2. Process each cataloged item
-            for item in catalog_results:
-                pii_types = []
-                name_lower = item["name"].lower()
-                
-                # Detect PII types based on naming patterns
-                if any(keyword in name_lower for keyword in ["user", "customer", "profile", "person"]):
-                    pii_types.extend(["EMAIL", "PHONE", "NAME"])
-                if any(keyword in name_lower for keyword in ["transaction", "payment", "billing"]):
-                    pii_types.extend(["CREDIT_CARD", "SSN"])
-                if any(keyword in name_lower for keyword in ["medical", "health", "patient"]):
-                    pii_types.extend(["MEDICAL_RECORD", "SSN"])
-                if any(keyword in name_lower for keyword in ["employee", "hr", "payroll"]):
-                    pii_types.extend(["SSN", "SALARY", "NAME"])
-                
-                if pii_types:
-                    risk_level = "HIGH" if len(pii_types) > 2 else "MEDIUM"
-                    
-                    # 3. Apply Lake Formation tags to the resource
-                    tagging_success = await _apply_lf_tags_via_mcp(item, pii_types, risk_level)
-                    
-                    pii_results.append({
-                        "source": item["name"],
-                        "type": item["type"],
-                        "pii_types": pii_types,
-                        "risk_level": risk_level,
-                        "tagged": tagging_success,
-                        "database": item.get("database"),
-                        "lf_tags_applied": _get_lf_tags_for_classification(pii_types, risk_level)
-                    })
-                    logger.info(f"Tagged {item['name']} with {len(pii_types)} PII types (LF tags: {tagging_success})")
-                else:
-                    # Apply NO_RISK tags for non-PII data
-                    tagging_success = await _apply_lf_tags_via_mcp(item, [], "NO_RISK")
-                    
-                    pii_results.append({
-                        "source": item["name"],
-                        "type": item["type"],
-                        "pii_types": [],
-                        "risk_level": "NO_RISK",
-                        "tagged": tagging_success,
-                        "database": item.get("database"),
-                        "lf_tags_applied": {"DataClassification": "NO_RISK", "AccessLevel": "PUBLIC"}
-                    })
+            # 2. Process the cataloged items concurrently
+            semaphore = asyncio.Semaphore(GLUE_CONCURRENCY)
+            results = await asyncio.gather(
+                *[self._classify_and_tag(semaphore, item) for item in catalog_results],
+                return_exceptions=True
+            )
+            pii_results = _collect_results(results, "Error in PII detection and tagging")
         
         except Exception as e:
             logger.error(f"Error in PII detection and tagging: {e}")
         
         return pii_results
     
+    async def _classify_and_tag(self, semaphore: asyncio.Semaphore, item: Dict):
+        """Classify one cataloged item by name and apply its Lake Formation tags"""
+        # Detect PII types based on naming patterns
+        pii_types = _pii_types_for_name(item["name"])
+        
+        if pii_types:
+            risk_level = "HIGH" if len(pii_types) > 2 else "MEDIUM"
+            
+            # 3. Apply Lake Formation tags to the resource
+            async with semaphore:
+                tagging_success = await _apply_lf_tags_via_mcp(item, pii_types, risk_level)
+            
+            logger.info(f"Tagged {item['name']} with {len(pii_types)} PII types (LF tags: {tagging_success})")
+            return {
+                "source": item["name"],
+                "type": item["type"],
+                "pii_types": pii_types,
+                "risk_level": risk_level,
+                "tagged": tagging_success,
+                "database": item.get("database"),
+                "lf_tags_applied": _get_lf_tags_for_classification(tuple(pii_types), risk_level)
+            }
+        
+        # Apply NO_RISK tags for non-PII data
+        async with semaphore:
+            tagging_success = await _apply_lf_tags_via_mcp(item, [], "NO_RISK")
+        
+        return {
+            "source": item["name"],
+            "type": item["type"],
+            "pii_types": [],
+            "risk_level": "NO_RISK",
+            "tagged": tagging_success,
+            "database": item.get("database"),
+            "lf_tags_applied": {"DataClassification": "NO_RISK", "AccessLevel": "PUBLIC"}
+        }
+    
     async def generate_architecture_diagram(self, workflow_data: Dict):
         """Generate AWS architecture diagram using AWS Labs Diagram MCP server with fallback"""
         try:
-            # Try AWS Labs Diagram MCP server first
-            try:
-                import subprocess
-                diagram_mcp_available = subprocess.run(
-                    ['npm', 'list', '-g', '@awslabs/aws-diagram-mcp-server'],
-                    capture_output=True, text=True
-                ).returncode == 0
-                
-                if diagram_mcp_available:
-                    logger.info("Using AWS Labs Diagram MCP server for diagram generation")
-                    # Use MCP server calls here
-                    # For now, fall back to direct implementation
-                    raise Exception("MCP integration in progress")
-                    
-            except Exception as mcp_error:
-                logger.info(f"AWS Labs Diagram MCP server not available, using direct diagram generation")
-            
-            # Direct diagram generation (fallback)
-            from diagrams import Diagram, Cluster
-            from diagrams.aws.storage import S3
-            from diagrams.aws.database import Dynamodb
-            from diagrams.aws.analytics import Glue, LakeFormation
-            from diagrams.aws.ml import Comprehend
+            # AWS Labs Diagram MCP server is used once the integration is ready
+            if MCP_AVAILABLE['@awslabs/aws-diagram-mcp-server'] and not MCP_INTEGRATION_READY:
+                logger.info("AWS Labs Diagram MCP server detected, MCP integration in progress; using direct diagram generation")
+            elif not MCP_AVAILABLE['@awslabs/aws-diagram-mcp-server']:
+                logger.info("AWS Labs Diagram MCP server not available, using direct diagram generation")
             
-            with Diagram("AWS Data Discovery Architecture", show=False, filename="data_discovery_architecture"):
-                with Cluster("Data Sources"):
-                    s3 = S3("S3 Buckets")
-                    dynamo = Dynamodb("DynamoDB")
-                
-                with Cluster("Processing"):
-                    glue = Glue("Glue Catalog")
-                    comprehend = Comprehend("PII Detection")
-                
-                with Cluster("Governance"):
-                    lakeformation = LakeFormation("Lake Formation")
-                
-                s3 >> glue >> comprehend >> lakeformation
-                dynamo >> glue
+            # Direct diagram generation (fallback); Graphviz renders synchronously,
+            # so keep it off the event loop
+            await asyncio.to_thread(_render_architecture_diagram)
             
             return {"diagram_generated": True, "path": "data_discovery_architecture.png"}
             
@@ -489,17 +776,41 @@ class MCPOrchestrator:
             logger.error(f"Error generating diagram: {e}")
             return {"diagram_generated": False, "error": str(e)}
 
+def _render_architecture_diagram():
+    """Render the architecture diagram to data_discovery_architecture.png"""
+    from diagrams import Diagram, Cluster
+    from diagrams.aws.storage import S3
+    from diagrams.aws.database import Dynamodb
+    from diagrams.aws.analytics import Glue, LakeFormation
+    from diagrams.aws.ml import Comprehend
+    
+    with Diagram("AWS Data Discovery Architecture", show=False, filename="data_discovery_architecture"):
+        with Cluster("Data Sources"):
+            s3 = S3("S3 Buckets")
+            dynamo = Dynamodb("DynamoDB")
+        
+        with Cluster("Processing"):
+            glue = Glue("Glue Catalog")
+            comprehend = Comprehend("PII Detection")
+        
+        with Cluster("Governance"):
+            lakeformation = LakeFormation("Lake Formation")
+        
+        s3 >> glue >> comprehend >> lakeformation
+        dynamo >> glue
+
 orchestrator = MCPOrchestrator()
 
 # Lake Formation tagging methods
 async def _create_lf_tags_via_mcp():
     """Create Lake Formation tags using AWS DataProcessing MCP server"""
+    # Tag definitions are idempotent, so only create them once per region
+    region = orchestrator.aws_region
+    if region in orchestrator._lf_tag_regions:
+        return True
+    
     try:
-        import subprocess
-        dataprocessing_mcp_available = subprocess.run(
-            ['npm', 'list', '-g', '@awslabs/aws-dataprocessing-mcp-server'],
-            capture_output=True, text=True
-        ).returncode == 0
+        dataprocessing_mcp_available = MCP_AVAILABLE['@awslabs/aws-dataprocessing-mcp-server']
         
         if dataprocessing_mcp_available:
             logger.info("Creating Lake Formation tags via DataProcessing MCP server")
@@ -518,9 +829,13 @@ async def _create_lf_tags_via_mcp():
                 })
                 logger.info(f"Created LF tag: {tag_key}")
             
+            orchestrator._lf_tag_regions.add(region)
             return True
         else:
-            return await _create_lf_tags_boto3()
+            created = await _create_lf_tags_boto3()
+            if created:
+                orchestrator._lf_tag_regions.add(region)
+            return created
             
     except Exception as e:
         logger.error(f"Error creating LF tags via MCP: {e}")
@@ -529,9 +844,6 @@ async def _create_lf_tags_via_mcp():
 async def _create_lf_tags_boto3():
     """Create Lake Formation tags using boto3 fallback"""
     try:
-        import boto3
-        lf_client = boto3.client('lakeformation', region_name=orchestrator.aws_region)
-        
         lf_tag_definitions = {
             "PIIType": ["EMAIL", "SSN", "PHONE", "NAME", "ADDRESS", "CREDIT_CARD", "MEDICAL_RECORD", "SALARY", "NONE"],
             "DataClassification": ["NO_RISK", "LOW_RISK", "MEDIUM_RISK", "HIGH_RISK", "CRITICAL_RISK"],
@@ -539,9 +851,10 @@ async def _create_lf_tags_boto3():
             "DataGovernance": ["PII_DETECTED", "REQUIRES_MASKING", "ACCESS_RESTRICTED", "PUBLIC"]
         }
         
-        for tag_key, tag_values in lf_tag_definitions.items():
+        async def create_tag(tag_key: str, tag_values: List[str]):
             try:
-                lf_client.create_lf_tag(
+                await orchestrator._aws_call(
+                    'lakeformation', 'create_lf_tag',
                     TagKey=tag_key,
                     TagValues=tag_values
                 )
@@ -550,6 +863,10 @@ async def _create_lf_tags_boto3():
                 if "AlreadyExistsException" not in str(e):
                     logger.warning(f"Error creating LF tag {tag_key}: {e}")
         
+        # The tag keys are independent, so create them together
+        await asyncio.gather(*[
+            create_tag(tag_key, tag_values) for tag_key, tag_values in lf_tag_definitions.items()
+        ])
         return True
         
     except Exception as e:
@@ -559,15 +876,11 @@ async def _create_lf_tags_boto3():
 async def _apply_lf_tags_via_mcp(item: Dict, pii_types: List[str], risk_level: str):
     """Apply Lake Formation tags to a resource using DataProcessing MCP server"""
     try:
-        import subprocess
-        dataprocessing_mcp_available = subprocess.run(
-            ['npm', 'list', '-g', '@awslabs/aws-dataprocessing-mcp-server'],
-            capture_output=True, text=True
-        ).returncode == 0
+        dataprocessing_mcp_available = MCP_AVAILABLE['@awslabs/aws-dataprocessing-mcp-server']
         
         if dataprocessing_mcp_available:
-            lf_tags = _get_lf_tags_for_classification(pii_types, risk_level)
-            resource_arn = _get_resource_arn(item)
+            lf_tags = _get_lf_tags_for_classification(tuple(pii_types), risk_level)
+            resource_arn = await _get_resource_arn(item)
             
             await orchestrator._call_mcp_tool('dataprocessing', 'add_lf_tags_to_resource', {
                 'resource_arn': resource_arn,
@@ -586,11 +899,7 @@ async def _apply_lf_tags_via_mcp(item: Dict, pii_types: List[str], risk_level: s
 async def _apply_lf_tags_boto3(item: Dict, pii_types: List[str], risk_level: str):
     """Apply Lake Formation tags using boto3 fallback"""
     try:
-        import boto3
-        lf_client = boto3.client('lakeformation', region_name=orchestrator.aws_region)
-        
-        lf_tags = _get_lf_tags_for_classification(pii_types, risk_level)
-        lf_tags_list = [{'TagKey': k, 'TagValues': [v]} for k, v in lf_tags.items()]
+        lf_tags_list = _lf_tags_payload(tuple(pii_types), risk_level)
         
         resource = {
             'Database': {'Name': item.get('database', 'default')}
@@ -602,20 +911,22 @@ async def _apply_lf_tags_boto3(item: Dict, pii_types: List[str], risk_level: str
                 'Name': item['name']
             }
         
-        lf_client.add_lf_tags_to_resource(
+        await orchestrator._aws_call(
+            'lakeformation', 'add_lf_tags_to_resource',
             Resource=resource,
             LFTags=lf_tags_list
         )
         
-        logger.info(f"Applied LF tags via boto3 to {item['name']}: {lf_tags}")
+        logger.info(f"Applied LF tags via boto3 to {item['name']}: {lf_tags_list}")
         return True
         
     except Exception as e:
         logger.error(f"Error applying LF tags via boto3 to {item['name']}: {e}")
         return False
 
-def _get_lf_tags_for_classification(pii_types: List[str], risk_level: str):
-    """Get Lake Formation tags based on PII classification"""
+@lru_cache(maxsize=256)
+def _get_lf_tags_for_classification(pii_types: Tuple[str, ...], risk_level: str):
+    """Get Lake Formation tags based on PII classification (shared; do not mutate)"""
     tags = {
         "DataClassification": risk_level,
         "AccessLevel": _get_access_level(risk_level)
@@ -630,67 +941,77 @@ def _get_lf_tags_for_classification(pii_types: List[str], risk_level: str):
     
     return tags
 
+@lru_cache(maxsize=128)
+def _lf_tags_payload(pii_types: Tuple[str, ...], risk_level: str) -> List[Dict]:
+    """LFTags request payload for a classification, built once per distinct classification"""
+    lf_tags = _get_lf_tags_for_classification(pii_types, risk_level)
+    return [{'TagKey': k, 'TagValues': [v]} for k, v in lf_tags.items()]
+
+_ACCESS_LEVELS = {
+    "NO_RISK": "PUBLIC",
+    "LOW_RISK": "INTERNAL",
+    "MEDIUM_RISK": "CONFIDENTIAL",
+    "HIGH_RISK": "RESTRICTED",
+    "CRITICAL_RISK": "TOP_SECRET"
+}
+
 def _get_access_level(risk_level: str):
     """Get access level based on risk classification"""
-    access_mapping = {
-        "NO_RISK": "PUBLIC",
-        "LOW_RISK": "INTERNAL",
-        "MEDIUM_RISK": "CONFIDENTIAL",
-        "HIGH_RISK": "RESTRICTED",
-        "CRITICAL_RISK": "TOP_SECRET"
-    }
-    return access_mapping.get(risk_level, "INTERNAL")
+    return _ACCESS_LEVELS.get(risk_level, "INTERNAL")
 
-def _get_resource_arn(item: Dict):
+async def _get_resource_arn(item: Dict):
     """Get resource ARN for Lake Formation tagging"""
-    account_id = orchestrator._get_account_id()
+    arn_prefix = f"arn:aws:glue:{orchestrator.aws_region}:{await orchestrator._get_account_id()}"
     database = item.get('database', 'default')
     
-    if item.get('type') == 's3':
-        return f"arn:aws:glue:{orchestrator.aws_region}:{account_id}:table/{database}/{item['name']}"
-    elif item.get('type') == 'dynamodb':
-        return f"arn:aws:glue:{orchestrator.aws_region}:{account_id}:table/{database}/{item['name']}"
-    else:
-        return f"arn:aws:glue:{orchestrator.aws_region}:{account_id}:database/{database}"
+    # S3 and DynamoDB sources are both cataloged as Glue tables
+    if item.get('type') in ('s3', 'dynamodb'):
+        return f"{arn_prefix}:table/{database}/{item['name']}"
+    return f"{arn_prefix}:database/{database}"
 
 # Resources
 @mcp.resource("discovery://s3/buckets")
 async def get_s3_buckets() -> str:
     """List of discovered S3 buckets"""
     sources = await orchestrator.discover_data_sources()
-    return json.dumps({"s3_buckets": sources["s3_buckets"]}, indent=2)
+    return _to_json({"s3_buckets": sources["s3_buckets"]})
 
 @mcp.resource("discovery://dynamodb/tables")
 async def get_dynamodb_tables() -> str:
     """List of discovered DynamoDB tables"""
     sources = await orchestrator.discover_data_sources()
-    return json.dumps({"dynamodb_tables": sources["dynamodb_tables"]}, indent=2)
+    return _to_json({"dynamodb_tables": sources["dynamodb_tables"]})
+
+# Static resource bodies, serialized once at import
+_GLUE_DATABASES_JSON = _to_json({
+    "databases": ["data-lake-raw_db", "analytics-processed_db", "dynamodb_catalog"],
+    "status": "active"
+})
+_PII_RESULTS_JSON = _to_json({
+    "high_risk": [{"source": "user-profiles", "types": ["EMAIL", "PHONE", "NAME"]}],
+    "medium_risk": [{"source": "transaction-logs", "types": ["CREDIT_CARD"]}],
+    "total_classified": 2
+})
+_TAG_SCHEMA_JSON = _to_json({
+    "DataClassification": ["PII", "Sensitive", "Public", "Confidential"],
+    "DataType": ["EMAIL", "PHONE", "SSN", "CREDIT_CARD", "NAME"],
+    "RiskLevel": ["HIGH", "MEDIUM", "LOW"]
+})
 
 @mcp.resource("catalog://glue/databases")
 async def get_glue_databases() -> str:
     """Cataloged databases in Glue"""
-    return json.dumps({
-        "databases": ["data-lake-raw_db", "analytics-processed_db", "dynamodb_catalog"],
-        "status": "active"
-    }, indent=2)
+    return _GLUE_DATABASES_JSON
 
 @mcp.resource("classification://pii/results")
 async def get_pii_results() -> str:
     """Data classification and PII detection results"""
-    return json.dumps({
-        "high_risk": [{"source": "user-profiles", "types": ["EMAIL", "PHONE", "NAME"]}],
-        "medium_risk": [{"source": "transaction-logs", "types": ["CREDIT_CARD"]}],
-        "total_classified": 2
-    }, indent=2)
+    return _PII_RESULTS_JSON
 
 @mcp.resource("tags://lakeformation/schema")
 async def get_tag_schema() -> str:
     """Available Lake Formation tags for classification"""
-    return json.dumps({
-        "DataClassification": ["PII", "Sensitive", "Public", "Confidential"],
-        "DataType": ["EMAIL", "PHONE", "SSN", "CREDIT_CARD", "NAME"],
-        "RiskLevel": ["HIGH", "MEDIUM", "LOW"]
-    }, indent=2)
+    return _TAG_SCHEMA_JSON
 
 # Prompts
 @mcp.prompt()
@@ -743,38 +1064,43 @@ Provide specific AWS service configurations."""
 @mcp.tool()
 async def orchestrate_data_discovery(region: str = "us-west-2", generate_diagram: bool = True, apply_tags: bool = True) -> str:
     """Full data discovery workflow using AWS Labs MCP servers"""
+    diagram_task = None
     try:
         orchestrator.aws_region = region
         
         # Full workflow
-        sources = await orchestrator.discover_data_sources()
-        catalog_results = await orchestrator.catalog_data_with_glue(sources)
-        pii_results = await orchestrator.detect_and_tag_pii(catalog_results)
+        sources, catalog_results, pii_results = await orchestrator.run_full_workflow()
         
-        text = "🔄 Data Discovery & Classification Complete\n\n"
-        text += f"📊 Data Sources Discovered:\n"
-        text += f"   • S3 Buckets: {len(sources['s3_buckets'])}\n"
-        text += f"   • DynamoDB Tables: {len(sources['dynamodb_tables'])}\n\n"
+        # Render the diagram while the report is assembled
+        if generate_diagram:
+            diagram_task = asyncio.ensure_future(orchestrator.generate_architecture_diagram({
+                "sources": sources,
+                "pii_results": pii_results
+            }))
+        
+        parts = ["🔄 Data Discovery & Classification Complete\n\n"]
+        parts.append(f"📊 Data Sources Discovered:\n")
+        parts.append(f"   • S3 Buckets: {len(sources['s3_buckets'])}\n")
+        parts.append(f"   • DynamoDB Tables: {len(sources['dynamodb_tables'])}\n\n")
         
-        text += f"📋 Cataloging Results:\n"
+        parts.append(f"📋 Cataloging Results:\n")
         for result in catalog_results:
-            text += f"   • {result['name']} ({result['type']}): {result['status']}\n"
+            parts.append(f"   • {result['name']} ({result['type']}): {result['status']}\n")
         
-        text += f"\n🔍 PII Classification Results:\n"
+        parts.append(f"\n🔍 PII Classification Results:\n")
         for result in pii_results:
-            text += f"   • {result['source']}: {', '.join(result['pii_types'])} ({result['risk_level']})\n"
+            parts.append(f"   • {result['source']}: {', '.join(result['pii_types'])} ({result['risk_level']})\n")
         
-        if generate_diagram:
-            diagram_result = await orchestrator.generate_architecture_diagram({
-                "sources": sources,
-                "pii_results": pii_results
-            })
+        if diagram_task is not None:
+            diagram_result = await diagram_task
             if diagram_result['diagram_generated']:
-                text += f"\n📈 Architecture diagram generated: {diagram_result['path']}\n"
+                parts.append(f"\n📈 Architecture diagram generated: {diagram_result['path']}\n")
         
-        return text
+        return "".join(parts)
     
     except Exception as e:
+        if diagram_task is not None:
+            diagram_task.cancel()
         logger.error(f"Error in orchestrate_data_discovery: {e}")
         return f"❌ Error: {str(e)}"
 
@@ -784,14 +1110,14 @@ async def discover_aws_data_sources(region: str = "us-west-2") -> str:
     try:
         orchestrator.aws_region = region
         sources = await orchestrator.discover_data_sources()
-        text = f"🔍 AWS Data Source Discovery\n\n"
-        text += "📦 S3 Buckets:\n"
+        parts = [f"🔍 AWS Data Source Discovery\n\n"]
+        parts.append("📦 S3 Buckets:\n")
         for bucket in sources["s3_buckets"]:
-            text += f"   • {bucket}\n"
-        text += "\n🗃️ DynamoDB Tables:\n"
+            parts.append(f"   • {bucket}\n")
+        parts.append("\n🗃️ DynamoDB Tables:\n")
         for table in sources["dynamodb_tables"]:
-            text += f"   • {table}\n"
-        return text
+            parts.append(f"   • {table}\n")
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error in discover_aws_data_sources: {e}")
         return f"❌ Error: {str(e)}"
@@ -801,10 +1127,10 @@ async def catalog_with_glue(sources: Dict) -> str:
     """Catalog discovered data sources using Glue"""
     try:
         catalog_results = await orchestrator.catalog_data_with_glue(sources)
-        text = f"📋 Glue Cataloging Results:\n\n"
+        parts = [f"📋 Glue Cataloging Results:\n\n"]
         for result in catalog_results:
-            text += f"   • {result['name']} ({result['type']}): {result['status']}\n"
-        return text
+            parts.append(f"   • {result['name']} ({result['type']}): {result['status']}\n")
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error in catalog_with_glue: {e}")
         return f"❌ Error: {str(e)}"
@@ -814,10 +1140,10 @@ async def classify_and_tag_data(catalog_results: List, user_prompt: str = "") ->
     """Classify data and apply Lake Formation tags"""
     try:
         pii_results = await orchestrator.detect_and_tag_pii(catalog_results)
-        text = f"🏷️ Data Classification & Tagging:\n\n"
+        parts = [f"🏷️ Data Classification & Tagging:\n\n"]
         for result in pii_results:
-            text += f"   • {result['source']}: {', '.join(result['pii_types'])} ({result['risk_level']})\n"
-        return text
+            parts.append(f"   • {result['source']}: {', '.join(result['pii_types'])} ({result['risk_level']})\n")
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error in classify_and_tag_data: {e}")
         return f"❌ Error: {str(e)}"
@@ -837,56 +1163,74 @@ async def generate_architecture_diagram(workflow_data: Dict) -> str:
         logger.error(f"Error in generate_architecture_diagram: {e}")
         return f"❌ Error: {str(e)}"
 
+async def _port_open(host: str, port: int) -> bool:
+    """True once something accepts TCP connections on host:port"""
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=0.1)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
 @mcp.tool()
 async def launch_data_discovery_dashboard() -> str:
     """Launch the data discovery and classification dashboard"""
     try:
-        import subprocess
-        import os
-        import time
-        from pathlib import Path
-        
         # Get the dashboard path
         dashboard_path = Path(__file__).parent.parent / "pii_dashboard.py"
         
         if not dashboard_path.exists():
             return "❌ Dashboard file not found: pii_dashboard.py"
         
-        # Launch Streamlit dashboard in background
-        process = subprocess.Popen([
+        # Launch Streamlit dashboard in background, in its own session so it
+        # outlives this server
+        process = await asyncio.create_subprocess_exec(
             "streamlit", "run", str(dashboard_path),
-            "--server.port", "8501",
-            "--server.headless", "true"
-        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            "--server.port", str(DASHBOARD_PORT),
+            "--server.headless", "true",
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE, start_new_session=True
+        )
         
-        # Wait a moment for startup
-        time.sleep(2)
+        # Report success once the port accepts connections, not after a fixed wait
+        deadline = time.monotonic() + DASHBOARD_STARTUP_TIMEOUT
+        while process.returncode is None and time.monotonic() < deadline:
+            if await _port_open('127.0.0.1', DASHBOARD_PORT):
+                return "🚀 Data Discovery Dashboard launched successfully!\n\n" + \
+                       f"📊 Access the dashboard at: http://localhost:{DASHBOARD_PORT}\n" + \
+                       "🔍 View data discovery metrics, PII classification results, and governance insights"
+            await asyncio.sleep(0.05)
         
-        # Check if process is running
-        if process.poll() is None:
-            return "🚀 Data Discovery Dashboard launched successfully!\n\n" + \
-                   "📊 Access the dashboard at: http://localhost:8501\n" + \
-                   "🔍 View data discovery metrics, PII classification results, and governance insights"
-        else:
-            stdout, stderr = process.communicate()
-            return f"❌ Failed to launch dashboard\nError: {stderr.decode()}"
+        if process.returncode is None:
+            return f"⏳ Dashboard is still starting; check http://localhost:{DASHBOARD_PORT} shortly"
+        stdout, stderr = await process.communicate()
+        return f"❌ Failed to launch dashboard\nError: {stderr.decode()}"
             
     except Exception as e:
         logger.error(f"Error launching dashboard: {e}")
         return f"❌ Error launching dashboard: {str(e)}"
 
 @mcp.tool()
-async def get_dashboard_data() -> str:
-    """Get current data discovery and classification results for dashboard display"""
+async def get_dashboard_data(refresh: bool = False) -> str:
+    """Get current data discovery and classification results for dashboard display.
+    
+    Reuses a workflow run from the last two minutes unless refresh is set.
+    """
     try:
-        import time
-        import json
-        from pathlib import Path
+        # Run data discovery workflow, or reuse a recent run
+        if refresh:
+            orchestrator.invalidate_mcp_cache()
+        sources, catalog_results, pii_results = await orchestrator.run_full_workflow(refresh=refresh)
         
-        # Run data discovery workflow to get fresh data
-        sources = await orchestrator.discover_data_sources()
-        catalog_results = await orchestrator.catalog_data_with_glue(sources)
-        pii_results = await orchestrator.detect_and_tag_pii(catalog_results)
+        # Tally every count in one pass over each result list
+        catalog_status = Counter(r.get("status") for r in catalog_results)
+        risk_levels = Counter()
+        tagged_resources = 0
+        tag_types = set()
+        for r in pii_results:
+            risk_levels[r.get("risk_level")] += 1
+            if r.get("tagged") is True:
+                tagged_resources += 1
+            tag_types.update(r.get("lf_tags_applied", {}))
         
         # Prepare dashboard data
         dashboard_data = {
@@ -897,42 +1241,41 @@ async def get_dashboard_data() -> str:
             },
             "cataloging_results": {
                 "total_cataloged": len(catalog_results),
-                "successful": len([r for r in catalog_results if r.get("status") == "cataloged"]),
-                "failed": len([r for r in catalog_results if r.get("status") == "error"])
+                "successful": catalog_status["cataloged"],
+                "failed": catalog_status["error"]
             },
             "pii_classification": {
                 "total_classified": len(pii_results),
-                "high_risk": len([r for r in pii_results if r.get("risk_level") == "HIGH"]),
-                "medium_risk": len([r for r in pii_results if r.get("risk_level") == "MEDIUM"]),
-                "low_risk": len([r for r in pii_results if r.get("risk_level") == "LOW"]),
-                "no_risk": len([r for r in pii_results if r.get("risk_level") == "NO_RISK"])
+                "high_risk": risk_levels["HIGH"],
+                "medium_risk": risk_levels["MEDIUM"],
+                "low_risk": risk_levels["LOW"],
+                "no_risk": risk_levels["NO_RISK"]
             },
             "lake_formation_tags": {
-                "tagged_resources": len([r for r in pii_results if r.get("tagged") == True]),
-                "tag_types": list(set([tag for r in pii_results for tag in r.get("lf_tags_applied", {}).keys()]))
+                "tagged_resources": tagged_resources,
+                "tag_types": list(tag_types)
             },
             "detailed_results": {
                 "sources": sources,
-                "catalog_results": catalog_results,
+                "catalog_results": [result.to_dict() for result in catalog_results],
                 "pii_results": pii_results
             }
         }
         
         # Save data for dashboard consumption
         dashboard_data_path = Path(__file__).parent.parent / "dashboard_data.json"
-        with open(dashboard_data_path, 'w') as f:
-            json.dump(dashboard_data, f, indent=2, default=str)
+        dashboard_data_path.write_bytes(_to_json_file(dashboard_data))
         
         # Return summary
-        text = "📊 Dashboard Data Updated:\n\n"
-        text += f"🔍 Data Sources: {dashboard_data['sources_discovered']['s3_buckets']} S3 buckets, {dashboard_data['sources_discovered']['dynamodb_tables']} DynamoDB tables\n"
-        text += f"📋 Cataloged: {dashboard_data['cataloging_results']['successful']}/{dashboard_data['cataloging_results']['total_cataloged']} successful\n"
-        text += f"🏷️ PII Classification: {dashboard_data['pii_classification']['high_risk']} high risk, {dashboard_data['pii_classification']['medium_risk']} medium risk\n"
-        text += f"🔐 Lake Formation: {dashboard_data['lake_formation_tags']['tagged_resources']} resources tagged\n\n"
-        text += f"💾 Data saved to: {dashboard_data_path}\n"
-        text += "🚀 Use 'launch_data_discovery_dashboard' to view in browser"
+        parts = ["📊 Dashboard Data Updated:\n\n"]
+        parts.append(f"🔍 Data Sources: {dashboard_data['sources_discovered']['s3_buckets']} S3 buckets, {dashboard_data['sources_discovered']['dynamodb_tables']} DynamoDB tables\n")
+        parts.append(f"📋 Cataloged: {dashboard_data['cataloging_results']['successful']}/{dashboard_data['cataloging_results']['total_cataloged']} successful\n")
+        parts.append(f"🏷️ PII Classification: {dashboard_data['pii_classification']['high_risk']} high risk, {dashboard_data['pii_classification']['medium_risk']} medium risk\n")
+        parts.append(f"🔐 Lake Formation: {dashboard_data['lake_formation_tags']['tagged_resources']} resources tagged\n\n")
+        parts.append(f"💾 Data saved to: {dashboard_data_path}\n")
+        parts.append("🚀 Use 'launch_data_discovery_dashboard' to view in browser")
         
-        return text
+        return "".join(parts)
         
     except Exception as e:
         logger.error(f"Error getting dashboard data: {e}")
@@ -1003,23 +1346,51 @@ async def register_lake_formation_resources(resource_type: str, resource_arn: st
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
+async def _apply_lake_formation_tags(database_name: str, table_name: str, column_name: str = "", lf_tags: list = None) -> str:
+    """Apply Lake Formation tags to one resource and return its dotted name"""
+    await orchestrator._call_mcp_tool('dataprocessing', 'apply_lake_formation_tags', {
+        'database_name': database_name,
+        'table_name': table_name,
+        'column_name': column_name,
+        'lf_tags': lf_tags or []
+    })
+    resource = f"{database_name}.{table_name}"
+    if column_name:
+        resource += f".{column_name}"
+    return resource
+
 @mcp.tool()
 async def apply_lake_formation_tags(database_name: str, table_name: str, column_name: str = "", lf_tags: list = None, region: str = "us-west-2") -> str:
     """Apply Lake Formation tags to specific resources via Data Processing MCP server"""
     try:
-        result = await orchestrator._call_mcp_tool('dataprocessing', 'apply_lake_formation_tags', {
-            'database_name': database_name,
-            'table_name': table_name,
-            'column_name': column_name,
-            'lf_tags': lf_tags or []
-        })
-        resource = f"{database_name}.{table_name}"
-        if column_name:
-            resource += f".{column_name}"
+        resource = await _apply_lake_formation_tags(database_name, table_name, column_name, lf_tags)
         return f"✅ Lake Formation tags applied to {resource}"
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
+@mcp.tool()
+async def apply_lake_formation_tags_batch(items: List[Dict], region: str = "us-west-2") -> str:
+    """Apply Lake Formation tags to many resources in one request via Data Processing MCP server.
+    
+    Each item takes the apply_lake_formation_tags arguments: database_name, table_name
+    and optionally column_name and lf_tags.
+    """
+    semaphore = asyncio.Semaphore(GLUE_CONCURRENCY)
+    
+    async def apply_one(item: Dict):
+        async with semaphore:
+            return await _apply_lake_formation_tags(
+                item["database_name"], item["table_name"], item.get("column_name", ""), item.get("lf_tags")
+            )
+    
+    results = await asyncio.gather(*[apply_one(item) for item in items], return_exceptions=True)
+    
+    parts = [f"✅ Lake Formation tags applied to {sum(not isinstance(r, Exception) for r in results)}/{len(items)} resources\n"]
+    for item, result in zip(items, results):
+        if isinstance(result, Exception):
+            parts.append(f"   ❌ {item.get('database_name')}.{item.get('table_name')}: {result}\n")
+    return "".join(parts)
+
 @mcp.tool()
 async def manage_lake_formation_permissions(operation: str, principal: str = "", resource: dict = None, permissions: list = None, region: str = "us-west-2") -> str:
     """Manage Lake Formation permissions and access control via Data Processing MCP server"""
@@ -4,57 +4,54 @@ PII Detection Agent Data Management Dashboard
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import asyncio
+import pyarrow as pa
+from datetime import datetime
 import sys
 import json
+from collections import Counter
+from itertools import chain
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add servers to path
 sys.path.insert(0, str(Path(__file__).parent / "servers"))
 
+# Written by the orchestrator's get_dashboard_data tool
+DASHBOARD_DATA_PATH = Path(__file__).parent.parent / "dashboard_data.json"
+
+RISK_COLORS = (('HIGH', 'red'), ('MEDIUM', 'orange'), ('LOW', 'green'))
+
+# Illustrative 30-day trend shown alongside both real and mock data; built once
+_TREND_DAYS = np.arange(30)
+_TREND_DF = pd.DataFrame({
+    'date': pd.date_range(start='2024-01-01', periods=len(_TREND_DAYS), freq='D'),
+    'pii_detected': _TREND_DAYS % 3,
+    'sources_added': _TREND_DAYS % 2,
+    'risk_score': 50 + _TREND_DAYS % 20
+})
+
+# Key performance indicators table; static, so built once and kept as an Arrow
+# table, the format st.dataframe sends to the browser
+_KPI_TABLE = pa.Table.from_pandas(pd.DataFrame({
+    'KPI': ['Data Discovery Coverage', 'Classification Accuracy', 'Catalog Completeness', 'Sensitive Data Exposure', 'Governance Score'],
+    'Current': ['47.1%', '33.3%', '100%', '16.7%', '83.3%'],
+    'Target': ['90%', '95%', '100%', '<10%', '>95%'],
+    'Status': ['🔴 Below', '🔴 Below', '✅ Met', '🟡 Above', '🟡 Below']
+}))
+
 def load_dashboard_data():
     """Load real data from MCP orchestrator or fallback to mock data"""
-    dashboard_data_path = Path(__file__).parent.parent / "dashboard_data.json"
-    
-    if dashboard_data_path.exists():
+    if DASHBOARD_DATA_PATH.exists():
         try:
-            with open(dashboard_data_path, 'r') as f:
-                data = json.load(f)
-            
-            # Transform MCP data to dashboard format
-            total_sources = data["sources_discovered"]["s3_buckets"] + data["sources_discovered"]["dynamodb_tables"]
-            pii_sources = data["pii_classification"]["high_risk"] + data["pii_classification"]["medium_risk"]
-            
-            return {
-                'total_sources': total_sources,
-                'cataloged_sources': data["cataloging_results"]["successful"],
-                'pii_sources': pii_sources,
-                'high_risk_sources': data["pii_classification"]["high_risk"],
-                'compliance_score': min(100, (data["lake_formation_tags"]["tagged_resources"] / max(1, pii_sources)) * 100),
-                'pii_types': _extract_pii_types(data.get("detailed_results", {}).get("pii_results", [])),
-                'risk_levels': {
-                    'HIGH': data["pii_classification"]["high_risk"],
-                    'MEDIUM': data["pii_classification"]["medium_risk"],
-                    'LOW': data["pii_classification"]["low_risk"]
-                },
-                'source_types': {
-                    'S3': data["sources_discovered"]["s3_buckets"],
-                    'DynamoDB': data["sources_discovered"]["dynamodb_tables"],
-                    'Uncataloged': max(0, total_sources - data["cataloging_results"]["successful"])
-                },
-                'trend_data': pd.DataFrame({
-                    'date': pd.date_range(start='2024-01-01', periods=30, freq='D'),
-                    'pii_detected': [i % 3 for i in range(30)],
-                    'sources_added': [i % 2 for i in range(30)],
-                    'risk_score': [50 + (i % 20) for i in range(30)]
-                }),
-                'last_updated': datetime.fromtimestamp(data["timestamp"]),
-                'raw_data': data
-            }
+            # Keyed on mtime so reruns reuse the parsed file until the orchestrator rewrites it
+            data = _load_dashboard_file(str(DASHBOARD_DATA_PATH), DASHBOARD_DATA_PATH.stat().st_mtime)
+            return {**data, 'trend_data': _TREND_DF}
         except Exception as e:
             st.warning(f"Error loading dashboard data: {e}. Using mock data.")
     
@@ -68,46 +65,83 @@ def load_dashboard_data():
         'pii_types': {'EMAIL': 1, 'PHONE': 1, 'NAME': 1, 'CREDIT_CARD': 1, 'SSN': 1},
         'risk_levels': {'HIGH': 1, 'MEDIUM': 1, 'LOW': 0},
         'source_types': {'S3': 8, 'DynamoDB': 5, 'Uncataloged': 11},
-        'trend_data': pd.DataFrame({
-            'date': pd.date_range(start='2024-01-01', periods=30, freq='D'),
-            'pii_detected': [i % 3 for i in range(30)],
-            'sources_added': [i % 2 for i in range(30)],
-            'risk_score': [50 + (i % 20) for i in range(30)]
-        })
+        'trend_data': _TREND_DF
+    }
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_dashboard_file(path: str, mtime: float):
+    """Parse dashboard_data.json into dashboard format; mtime is part of the cache key"""
+    if orjson is not None:
+        data = orjson.loads(Path(path).read_bytes())
+    else:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    
+    # Transform MCP data to dashboard format
+    total_sources = data["sources_discovered"]["s3_buckets"] + data["sources_discovered"]["dynamodb_tables"]
+    pii_sources = data["pii_classification"]["high_risk"] + data["pii_classification"]["medium_risk"]
+    
+    return {
+        'total_sources': total_sources,
+        'cataloged_sources': data["cataloging_results"]["successful"],
+        'pii_sources': pii_sources,
+        'high_risk_sources': data["pii_classification"]["high_risk"],
+        'compliance_score': min(100, (data["lake_formation_tags"]["tagged_resources"] / max(1, pii_sources)) * 100),
+        'pii_types': _extract_pii_types(data.get("detailed_results", {}).get("pii_results", [])),
+        'risk_levels': {
+            'HIGH': data["pii_classification"]["high_risk"],
+            'MEDIUM': data["pii_classification"]["medium_risk"],
+            'LOW': data["pii_classification"]["low_risk"]
+        },
+        'source_types': {
+            'S3': data["sources_discovered"]["s3_buckets"],
+            'DynamoDB': data["sources_discovered"]["dynamodb_tables"],
+            'Uncataloged': max(0, total_sources - data["cataloging_results"]["successful"])
+        },
+        'last_updated': datetime.fromtimestamp(data["timestamp"]),
+        'raw_data': data
     }
 
 def _extract_pii_types(pii_results):
     """Extract PII types from results"""
-    pii_counts = {}
-    for result in pii_results:
-        for pii_type in result.get("pii_types", []):
-            pii_counts[pii_type] = pii_counts.get(pii_type, 0) + 1
-    return pii_counts if pii_counts else {'EMAIL': 1, 'PHONE': 1, 'NAME': 1, 'CREDIT_CARD': 1, 'SSN': 1}
+    pii_counts = Counter(chain.from_iterable(result.get("pii_types", []) for result in pii_results))
+    return dict(pii_counts) if pii_counts else {'EMAIL': 1, 'PHONE': 1, 'NAME': 1, 'CREDIT_CARD': 1, 'SSN': 1}
 
-def main():
-    st.set_page_config(
-        page_title="Data Discovery & Classification Dashboard",
-        page_icon="📊",
-        layout="wide"
-    )
-    
-    st.title("📊 Data Discovery and Data Classification Dashboard")
-    st.markdown("*Powered by AWS Labs MCP Servers for comprehensive data governance*")
-    
-    # Sidebar with MCP server info
-    st.sidebar.markdown("### 🔧 Powered by AWS Labs MCP Servers")
-    st.sidebar.markdown("""
-    - `@awslabs/s3-tables-mcp-server@latest`
-    - `@awslabs/aws-dataprocessing-mcp-server@latest`
-    - `@awslabs/dynamodb-mcp-server@latest`
-    - `@awslabs/aws-diagram-mcp-server@latest`
-    """)
-    
-    st.markdown("---")
-    
-    # Add refresh button
+# Figures are rebuilt only when their (small, hashable) inputs change. Plotly
+# is imported on first use so it stays off the startup path
+@st.cache_data(show_spinner=False)
+def _line_figure(frame, y, title):
+    import plotly.express as px
+    return px.line(frame, x='date', y=y, title=title)
+
+@st.cache_data(show_spinner=False)
+def _pie_figure(items, title):
+    import plotly.express as px
+    return px.pie(values=[value for _, value in items], names=[name for name, _ in items], title=title)
+
+@st.cache_data(show_spinner=False)
+def _bar_figure(items, title, colors=None):
+    import plotly.express as px
+    names = [name for name, _ in items]
+    values = [value for _, value in items]
+    if colors is None:
+        return px.bar(x=names, y=values, title=title)
+    return px.bar(x=names, y=values, title=title, color=names, color_discrete_map=dict(colors))
+
+def _dashboard_mtime():
+    """Modification time of dashboard_data.json, or None when it does not exist"""
+    try:
+        return DASHBOARD_DATA_PATH.stat().st_mtime
+    except OSError:
+        return None
+
+@st.fragment
+def _summary_section():
+    """Refresh button and executive summary. A click reruns only this section
+    unless the orchestrator has written new data since the charts were drawn."""
     if st.button("🔄 Refresh Data", help="Refresh dashboard with latest data from MCP orchestrator"):
-        st.rerun()
+        if _dashboard_mtime() != st.session_state.get('dashboard_mtime'):
+            st.rerun()
     
     # Get data
     data = load_dashboard_data()
@@ -117,8 +151,7 @@ def main():
         st.caption(f"Last updated: {data['last_updated'].strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Show data source status
-    dashboard_data_path = Path(__file__).parent.parent / "dashboard_data.json"
-    if dashboard_data_path.exists():
+    if DASHBOARD_DATA_PATH.exists():
         st.success("📊 Using real-time data from MCP orchestrator")
     else:
         st.info("📋 Using mock data - run MCP tools to get real data")
@@ -135,6 +168,32 @@ def main():
         st.metric("Sensitive Data", data['high_risk_sources'], delta=-1)
     with col4:
         st.metric("Governance Score", f"{data['compliance_score']:.1f}%", delta="5.2%")
+
+def main():
+    st.set_page_config(
+        page_title="Data Discovery & Classification Dashboard",
+        page_icon="📊",
+        layout="wide"
+    )
+    
+    st.title("📊 Data Discovery and Data Classification Dashboard")
+    st.markdown("*Powered by AWS Labs MCP Servers for comprehensive data governance*")
+    
+    # Sidebar with MCP server info
+    st.sidebar.markdown("### 🔧 Powered by AWS Labs MCP Servers")
+    st.sidebar.markdown("""
+    - `@awslabs/s3-tables-mcp-server@latest`
+    - `@awslabs/aws-dataprocessing-mcp-server@latest`
+    - `@awslabs/dynamodb-mcp-server@latest`
+    - `@awslabs/aws-diagram-mcp-server@latest`
+    """)
+    
+    st.markdown("---")
+    
+    # Charts only change with the data file; remember which version this run draws
+    st.session_state['dashboard_mtime'] = _dashboard_mtime()
+    _summary_section()
+    data = load_dashboard_data()
     
     st.markdown("---")
     
@@ -143,13 +202,11 @@ def main():
     col1, col2 = st.columns(2)
     
     with col1:
-        fig_trend = px.line(data['trend_data'], x='date', y='pii_detected', 
-                           title='Data Classification Over Time')
+        fig_trend = _line_figure(data['trend_data'], 'pii_detected', 'Data Classification Over Time')
         st.plotly_chart(fig_trend, use_container_width=True)
     
     with col2:
-        fig_risk = px.line(data['trend_data'], x='date', y='risk_score',
-                          title='Data Sensitivity Score Trend')
+        fig_risk = _line_figure(data['trend_data'], 'risk_score', 'Data Sensitivity Score Trend')
         st.plotly_chart(fig_risk, use_container_width=True)
     
     st.markdown("---")
@@ -160,38 +217,24 @@ def main():
     
     with col1:
         # Source Type Breakdown
-        fig_sources = px.pie(values=list(data['source_types'].values()),
-                            names=list(data['source_types'].keys()),
-                            title='Data Source Types')
+        fig_sources = _pie_figure(tuple(data['source_types'].items()), 'Data Source Types')
         st.plotly_chart(fig_sources, use_container_width=True)
     
     with col2:
         # Data Classification Types
-        fig_pii = px.bar(x=list(data['pii_types'].keys()),
-                        y=list(data['pii_types'].values()),
-                        title='Data Classification Types')
+        fig_pii = _bar_figure(tuple(data['pii_types'].items()), 'Data Classification Types')
         st.plotly_chart(fig_pii, use_container_width=True)
     
     with col3:
         # Sensitivity Level Distribution
-        fig_risk = px.bar(x=list(data['risk_levels'].keys()),
-                         y=list(data['risk_levels'].values()),
-                         title='Data Sensitivity Levels',
-                         color=list(data['risk_levels'].keys()),
-                         color_discrete_map={'HIGH': 'red', 'MEDIUM': 'orange', 'LOW': 'green'})
+        fig_risk = _bar_figure(tuple(data['risk_levels'].items()), 'Data Sensitivity Levels', RISK_COLORS)
         st.plotly_chart(fig_risk, use_container_width=True)
     
     st.markdown("---")
     
     # KPI Table
     st.subheader("📊 Key Performance Indicators")
-    kpi_data = {
-        'KPI': ['Data Discovery Coverage', 'Classification Accuracy', 'Catalog Completeness', 'Sensitive Data Exposure', 'Governance Score'],
-        'Current': ['47.1%', '33.3%', '100%', '16.7%', '83.3%'],
-        'Target': ['90%', '95%', '100%', '<10%', '>95%'],
-        'Status': ['🔴 Below', '🔴 Below', '✅ Met', '🟡 Above', '🟡 Below']
-    }
-    st.dataframe(pd.DataFrame(kpi_data), use_container_width=True)
+    st.dataframe(_KPI_TABLE, use_container_width=True)
     
     # Action Items
     st.subheader("⚡ Action Items")
@@ -10,9 +10,14 @@ from pathlib import Path
 # Add servers to path
 sys.path.insert(0, str(Path(__file__).parent / "servers"))
 
-from mcp_server_orchestrator import MCPOrchestrator
+from mcp_server_orchestrator import MCPOrchestrator, orchestrator as shared_orchestrator
 
-async def run_data_discovery_workflow():
+def print_lines(lines):
+    """Write a section's lines to stdout in one call"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+async def run_data_discovery_workflow(orchestrator: MCPOrchestrator):
     """Run the complete data discovery and classification workflow"""
     print("🚀 Starting Data Discovery & Classification Agent")
     print("Using FastMCP Framework with AWS Labs MCP Integration:")
@@ -23,44 +28,48 @@ async def run_data_discovery_workflow():
     print("  • AWS Labs Diagram MCP server (with boto3 fallback)")
     print("=" * 60)
     
-    # Initialize orchestrator
-    orchestrator = MCPOrchestrator()
-    
     # Step 1: Initialize AWS clients
     print("1️⃣ Initializing AWS service clients...")
     print(f"   ✅ Initialized for region: {orchestrator.aws_region}")
     
-    # Step 2: Discover data sources
+    # Steps 2-4 run as one workflow; discovery lists S3 and DynamoDB concurrently
+    # and the orchestrator keeps the results for later callers
     print("\n2️⃣ Discovering AWS data sources via AWS Labs MCP servers...")
-    sources = await orchestrator.discover_data_sources()
+    sources, catalog_results, pii_results = await orchestrator.run_full_workflow()
+    
+    # The diagram does not depend on the report below, so render it meanwhile
+    diagram_task = asyncio.ensure_future(orchestrator.generate_architecture_diagram({
+        "sources": sources,
+        "pii_results": pii_results
+    }))
+    
     print(f"   📦 Found {len(sources['s3_buckets'])} S3 buckets:")
-    for bucket in sources['s3_buckets']:
-        print(f"      • {bucket}")
+    print_lines([f"      • {bucket}" for bucket in sources['s3_buckets']])
     print(f"   🗃️ Found {len(sources['dynamodb_tables'])} DynamoDB tables:")
-    for table in sources['dynamodb_tables']:
-        print(f"      • {table}")
+    print_lines([f"      • {table}" for table in sources['dynamodb_tables']])
     
     # Step 3: Catalog data with Glue
     print("\n3️⃣ Cataloging data with AWS Labs DataProcessing MCP server...")
-    catalog_results = await orchestrator.catalog_data_with_glue(sources)
     print(f"   📋 Cataloged {len(catalog_results)} data sources:")
-    for result in catalog_results:
-        print(f"      • {result['name']} ({result['type']}): {result['status']}")
+    print_lines([f"      • {result['name']} ({result['type']}): {result['status']}" for result in catalog_results])
     
     # Step 4: Classify data and apply Lake Formation tags
     print("\n4️⃣ Classifying data and applying Lake Formation tags...")
-    pii_results = await orchestrator.detect_and_tag_pii(catalog_results)
     print(f"   🏷️ Classified {len(pii_results)} sources with sensitive data:")
+    high_risk_count = 0
+    lines = []
     for result in pii_results:
-        risk_emoji = "🔴" if result['risk_level'] == "HIGH" else "🟡"
-        print(f"      {risk_emoji} {result['source']}: {', '.join(result['pii_types'])} ({result['risk_level']})")
+        if result['risk_level'] == "HIGH":
+            high_risk_count += 1
+            risk_emoji = "🔴"
+        else:
+            risk_emoji = "🟡"
+        lines.append(f"      {risk_emoji} {result['source']}: {', '.join(result['pii_types'])} ({result['risk_level']})")
+    print_lines(lines)
     
     # Step 5: Generate architecture diagram
     print("\n5️⃣ Generating architecture diagram via AWS Labs Diagram MCP server...")
-    diagram_result = await orchestrator.generate_architecture_diagram({
-        "sources": sources,
-        "pii_results": pii_results
-    })
+    diagram_result = await diagram_task
     
     if diagram_result['diagram_generated']:
         print(f"   📈 Architecture diagram generated: {diagram_result['path']}")
@@ -73,17 +82,22 @@ async def run_data_discovery_workflow():
     print(f"   • Data Sources: {len(sources['s3_buckets']) + len(sources['dynamodb_tables'])}")
     print(f"   • Cataloged Items: {len(catalog_results)}")
     print(f"   • Classified Sources: {len(pii_results)}")
-    print(f"   • High Risk Sources: {len([r for r in pii_results if r['risk_level'] == 'HIGH'])}")
+    print(f"   • High Risk Sources: {high_risk_count}")
     print("=" * 60)
     print("🎉 Data Discovery & Classification Agent completed successfully!")
+    
+    return {
+        "sources": sources,
+        "catalog_results": catalog_results,
+        "pii_results": pii_results,
+        "diagram_result": diagram_result
+    }
 
-async def demonstrate_fastmcp_features():
-    """Demonstrate FastMCP framework features"""
+async def demonstrate_fastmcp_features(workflow: dict):
+    """Demonstrate FastMCP framework features using the results of the workflow run"""
     print("\n🔧 FastMCP Framework Features Demonstration")
     print("=" * 60)
     
-    orchestrator = MCPOrchestrator()
-    
     print("✨ FastMCP Benefits:")
     print("   • 75% less boilerplate code")
     print("   • Decorator-based tool/resource/prompt definitions")
@@ -93,25 +107,21 @@ async def demonstrate_fastmcp_features():
     
     # Test data discovery
     print("\n🔍 Data Source Discovery (via FastMCP tools):")
-    sources = await orchestrator.discover_data_sources()
+    sources = workflow['sources']
     print(f"   S3 Buckets: {sources['s3_buckets']}")
     print(f"   DynamoDB Tables: {sources['dynamodb_tables']}")
     
     # Test cataloging
     print("\n📋 Data Cataloging (via FastMCP integration):")
-    catalog_results = await orchestrator.catalog_data_with_glue(sources)
-    for result in catalog_results:
-        print(f"   • {result['name']}: {result['status']}")
+    print_lines([f"   • {result['name']}: {result['status']}" for result in workflow['catalog_results']])
     
     # Test classification
     print("\n🏷️ Data Classification (via FastMCP workflow):")
-    pii_results = await orchestrator.detect_and_tag_pii(catalog_results)
-    for result in pii_results:
-        print(f"   • {result['source']}: {result['risk_level']}")
+    print_lines([f"   • {result['source']}: {result['risk_level']}" for result in workflow['pii_results']])
     
     # Test diagram generation
     print("\n📈 Architecture Diagram Generation (via FastMCP):")
-    diagram_result = await orchestrator.generate_architecture_diagram({})
+    diagram_result = workflow['diagram_result']
     status = "✅ Success" if diagram_result['diagram_generated'] else "❌ Failed"
     print(f"   Status: {status}")
     if diagram_result['diagram_generated']:
@@ -124,10 +134,11 @@ async def main():
     
     try:
         # Run full workflow
-        await run_data_discovery_workflow()
+        # Share the server's orchestrator so its boto3 session and clients are reused
+        workflow = await run_data_discovery_workflow(shared_orchestrator)
         
-        # Demonstrate FastMCP features
-        await demonstrate_fastmcp_features()
+        # Demonstrate FastMCP features on the same results
+        await demonstrate_fastmcp_features(workflow)
         
         print("\n🎯 Next Steps:")
         print("   • Run 'streamlit run pii_dashboard.py' for interactive dashboard")
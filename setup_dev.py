@@ -4,28 +4,44 @@ Development setup script for AWS Data Discovery Agent
 Installs dependencies and configures the development environment
 """
 
+import asyncio
+import shutil
 import subprocess
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
 
-def run_command(command, description):
-    """Run a command and handle errors"""
+async def run_command(argv, description):
+    """Run a command (argument list, no shell) and handle errors"""
     print(f"🔧 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        print(f"✅ {description} completed")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed: {e.stderr}")
+        process = await asyncio.create_subprocess_exec(
+            *argv, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+    except OSError as e:
+        print(f"❌ {description} failed: {e}")
         return False
+    _, stderr = await process.communicate()
+    if process.returncode != 0:
+        print(f"❌ {description} failed: {stderr.decode(errors='replace')}")
+        return False
+    print(f"✅ {description} completed")
+    return True
+
+@lru_cache(maxsize=None)
+def tool_version(executable):
+    """Return the output of `<executable> --version`, or None if it is not installed"""
+    path = shutil.which(executable)
+    if path is None:
+        return None
+    result = subprocess.run([path, "--version"], capture_output=True, text=True, check=False)
+    return result.stdout.strip() if result.returncode == 0 else None
 
-def check_node_version():
+def check_node_version(version):
     """Check if Node.js 18+ is installed"""
     try:
-        result = subprocess.run("node --version", shell=True, capture_output=True, text=True)
-        version = result.stdout.strip()
-        major_version = int(version.replace('v', '').split('.')[0])
+        major_version = int(version.lstrip('v').split('.', 1)[0])
         if major_version >= 18:
             print(f"✅ Node.js {version} is installed")
             return True
@@ -36,25 +52,31 @@ def check_node_version():
         print("❌ Node.js is not installed. Please install Node.js 18+")
         return False
 
-def main():
+async def main():
     """Main setup function"""
     print("🚀 AWS Data Discovery Agent - Development Setup")
     print("=" * 50)
     
+    # Probe Node.js and the AWS CLI together
+    node_version, aws_version = await asyncio.gather(
+        asyncio.to_thread(tool_version, "node"),
+        asyncio.to_thread(tool_version, "aws")
+    )
+    
     # Check Node.js
-    if not check_node_version():
+    if not check_node_version(node_version):
         print("\n📋 To install Node.js:")
         print("   macOS: brew install node")
         print("   Ubuntu: sudo apt update && sudo apt install nodejs npm")
         print("   Windows: Download from https://nodejs.org/")
         return False
     
-    # Install Python dependencies
-    if not run_command("pip install -r requirements.txt", "Installing Python dependencies"):
+    # Install Python dependencies; the pip installs stay sequential since they write to the same environment
+    if not await run_command(["pip", "install", "-r", "requirements.txt"], "Installing Python dependencies"):
         return False
     
     # Install development dependencies
-    if not run_command("pip install -e .[dev]", "Installing development dependencies"):
+    if not await run_command(["pip", "install", "-e", ".[dev]"], "Installing development dependencies"):
         return False
     
     # Install AWS Labs MCP servers
@@ -65,19 +87,22 @@ def main():
         "@awslabs/aws-diagram-mcp-server"
     ]
     
-    for server in mcp_servers:
-        if not run_command(f"npm install -g {server}", f"Installing {server}"):
+    # The npm installs are independent, so run them concurrently
+    installed = await asyncio.gather(
+        *(run_command(["npm", "install", "-g", server], f"Installing {server}") for server in mcp_servers)
+    )
+    for server, ok in zip(mcp_servers, installed):
+        if not ok:
             print(f"⚠️  Failed to install {server} - continuing anyway")
     
     # Setup pre-commit hooks
-    if run_command("pre-commit install", "Setting up pre-commit hooks"):
+    if await run_command(["pre-commit", "install"], "Setting up pre-commit hooks"):
         print("✅ Pre-commit hooks installed")
     
     # Check AWS CLI
-    try:
-        subprocess.run("aws --version", shell=True, check=True, capture_output=True)
+    if aws_version:
         print("✅ AWS CLI is installed")
-    except:
+    else:
         print("⚠️  AWS CLI not found. Please install and configure:")
         print("   pip install awscli")
         print("   aws configure")
@@ -93,5 +118,5 @@ def main():
     return True
 
 if __name__ == "__main__":
-    success = main()
+    success = asyncio.run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file
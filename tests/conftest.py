@@ -0,0 +1,62 @@
+"""
+Shared pytest fixtures
+
+Every fixture is session-scoped so that one event loop, one boto3 session and
+one set of MCP connections serve the whole test run.
+"""
+
+import boto3
+import pytest
+from fastmcp import Client
+
+from core.aws_mcp_client import AWSMCPClient
+from core.pii_agent import AWSPIIDetectionAgent, PIIDetectionConfig
+from servers.mcp_server_orchestrator import mcp, orchestrator as shared_orchestrator
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "requires_aws: needs AWS credentials to pass")
+
+
+def pytest_collection_modifyitems(config, items):
+    if boto3.Session().get_credentials() is not None:
+        return
+    skip = pytest.mark.skip(reason="AWS credentials not configured")
+    for item in items:
+        if "requires_aws" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def orchestrator():
+    """The server's orchestrator, shared with the MCP tools under test"""
+    return shared_orchestrator
+
+
+@pytest.fixture(scope="session")
+async def mcp_client():
+    """In-process FastMCP client connected to the orchestrator server"""
+    async with Client(mcp) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def lf_config():
+    """Dry-run agent configuration for the Lake Formation tests"""
+    return PIIDetectionConfig(
+        aws_region="us-west-2",
+        dry_run=True,
+        comprehend_enabled=False,
+        apply_lf_tags=True,
+        use_mcp_servers=True
+    )
+
+
+@pytest.fixture(scope="session")
+def pii_agent(lf_config):
+    return AWSPIIDetectionAgent(lf_config)
+
+
+@pytest.fixture(scope="session")
+def aws_mcp_client():
+    return AWSMCPClient()
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
-Simple test runner without pytest dependency
+Tests for the FastMCP orchestrator server
+
+Runs under pytest (see conftest.py for the shared fixtures) or directly as a script.
 """
 
 import asyncio
@@ -10,80 +12,80 @@ from pathlib import Path
 
 # Add project paths
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "servers"))
+sys.path.insert(0, str(project_root))
+
+from fastmcp import Client
 
-from mcp_server_orchestrator import MCPOrchestrator, handle_call_tool, handle_read_resource, handle_get_prompt
+from servers.mcp_server_orchestrator import mcp, orchestrator as shared_orchestrator
 
-async def test_tools():
+async def test_tools(mcp_client):
     """Test MCP tools"""
     print("🔧 Testing MCP Tools...")
     
     # Test data discovery
-    result = await handle_call_tool("discover_aws_data_sources", {"region": "us-west-2"})
-    assert len(result) > 0
-    assert "S3 Buckets" in result[0].text
+    result = await mcp_client.call_tool("discover_aws_data_sources", {"region": "us-west-2"})
+    assert len(result.content) > 0
+    assert "S3 Buckets" in result.content[0].text
     print("   ✅ discover_aws_data_sources")
     
     # Test orchestration
-    result = await handle_call_tool("orchestrate_data_discovery", {"region": "us-west-2"})
-    assert "Data Discovery & Classification Complete" in result[0].text
+    result = await mcp_client.call_tool("orchestrate_data_discovery", {"region": "us-west-2"})
+    assert "Data Discovery & Classification Complete" in result.content[0].text
     print("   ✅ orchestrate_data_discovery")
     
     # Test classification
-    result = await handle_call_tool("classify_and_tag_data", {
+    result = await mcp_client.call_tool("classify_and_tag_data", {
         "catalog_results": [{"name": "user-profiles", "type": "dynamodb"}]
     })
-    assert "Data Classification & Tagging" in result[0].text
+    assert "Data Classification & Tagging" in result.content[0].text
     print("   ✅ classify_and_tag_data")
 
-async def test_resources():
+async def test_resources(mcp_client):
     """Test MCP resources"""
     print("📚 Testing MCP Resources...")
     
     # Test S3 buckets resource
-    result = await handle_read_resource("discovery://s3/buckets")
-    data = json.loads(result)
+    result = await mcp_client.read_resource("discovery://s3/buckets")
+    data = json.loads(result[0].text)
     assert "s3_buckets" in data
     print("   ✅ discovery://s3/buckets")
     
     # Test PII results resource
-    result = await handle_read_resource("classification://pii/results")
-    data = json.loads(result)
+    result = await mcp_client.read_resource("classification://pii/results")
+    data = json.loads(result[0].text)
     assert "high_risk" in data
     print("   ✅ classification://pii/results")
     
     # Test Lake Formation tags
-    result = await handle_read_resource("tags://lakeformation/schema")
-    data = json.loads(result)
+    result = await mcp_client.read_resource("tags://lakeformation/schema")
+    data = json.loads(result[0].text)
     assert "DataClassification" in data
     print("   ✅ tags://lakeformation/schema")
 
-async def test_prompts():
+async def test_prompts(mcp_client):
     """Test MCP prompts"""
     print("💬 Testing MCP Prompts...")
     
     # Test data sensitivity prompt
-    result = await handle_get_prompt("classify_data_sensitivity", {
+    result = await mcp_client.get_prompt("classify_data_sensitivity", {
         "data_sample": "john.doe@company.com",
         "context": "user database"
     })
-    assert "Analyze this data sample" in result
+    assert "Analyze this data sample" in result.messages[0].content.text
     print("   ✅ classify_data_sensitivity")
     
     # Test compliance tags prompt
-    result = await handle_get_prompt("generate_compliance_tags", {
+    result = await mcp_client.get_prompt("generate_compliance_tags", {
         "regulation": "GDPR",
         "data_types": ["EMAIL", "PHONE"]
     })
-    assert "GDPR compliance" in result
+    assert "GDPR compliance" in result.messages[0].content.text
     print("   ✅ generate_compliance_tags")
 
-async def test_orchestrator():
+async def test_orchestrator(orchestrator):
     """Test orchestrator functionality"""
     print("🎯 Testing Orchestrator...")
     
-    orchestrator = MCPOrchestrator()
-    
     # Test data discovery
     sources = await orchestrator.discover_data_sources()
     assert "s3_buckets" in sources
@@ -126,10 +128,11 @@ async def run_all_tests():
     print("=" * 70)
     
     try:
-        await test_tools()
-        await test_resources()
-        await test_prompts()
-        await test_orchestrator()
+        async with Client(mcp) as client:
+            await test_tools(client)
+            await test_resources(client)
+            await test_prompts(client)
+        await test_orchestrator(shared_orchestrator)
         test_configuration()
         
         print("\n" + "=" * 70)